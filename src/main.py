@@ -1,26 +1,14 @@
 import asyncio
 from viam.module.module import Module
 
+# Importing each model module registers its resource with the Viam registry. The
+# imports stay static so PyInstaller (build.sh) bundles the models into dist/main.
 try:
-    from models.mpu import Mpu
+    from models import mpu, bmp, loadcell  # noqa: F401
 except ModuleNotFoundError:
     # when running as local module with run.sh
-    from .models.mpu import Mpu
-    print("Could not find the module Mpu, locally")
-
-try:
-    from models.bmp import BmpSensor
-except ModuleNotFoundError:
-    # when running as local module with run.sh
-    from .models.bmp import BmpSensor
-    print("Could not find the module BmpSensor, locally")
-
-try:
-    from models.loadcell import LoadCell
-except ModuleNotFoundError:
-    # when running as local module with run.sh
-    from .models.loadcell import LoadCell
-    print("Could not find the module LoadCell, locally")
+    from .models import mpu, bmp, loadcell  # noqa: F401
+    print("Could not find the models package, locally")
 
 if __name__ == '__main__':
     asyncio.run(Module.run_from_registry())
@@ -1,23 +1,82 @@
+import asyncio
+import threading
+import time
 from typing import (Any, ClassVar, Mapping, Optional,Sequence)
 
 from typing_extensions import Self
-from viam.components.sensor import *
+from viam.components.sensor import Sensor
 from viam.proto.app.robot import ComponentConfig
 from viam.proto.common import ResourceName
 from viam.resource.base import ResourceBase
 from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
-from viam.utils import SensorReading, ValueTypes, struct_to_dict
+from viam.utils import SensorReading, ValueTypes
 import Adafruit_BMP.BMP085 as BMP085
 import board
 import busio
 
+# BMP085/BMP180 registers and commands (see datasheet section 3.5)
+_BMP_CONTROL = 0xF4
+_BMP_DATA = 0xF6
+_BMP_READ_TEMP_CMD = 0x2E
+_BMP_READ_PRESSURE_CMD = 0x34
+# Start-of-conversion bit in the control register, cleared by the chip once a conversion completes
+_BMP_SCO_BIT = 0x20
+_EOC_POLL_INTERVAL = 0.0005  # seconds
+_EOC_TIMEOUT = 0.05  # seconds, well above the slowest (ultra high resolution) conversion
+# International barometric formula, as used by Adafruit_BMP read_altitude (datasheet section 3.6)
+_ALTITUDE_SCALE = 44330.0  # meters
+_ALTITUDE_EXPONENT = 1.0 / 5.255
+
+
+def _wait_for_conversion(device):
+    """Poll the control register until the running conversion completes."""
+    deadline = time.monotonic() + _EOC_TIMEOUT
+    while device.readU8(_BMP_CONTROL) & _BMP_SCO_BIT:
+        if time.monotonic() > deadline:
+            raise OSError("BMP conversion did not complete")
+        time.sleep(_EOC_POLL_INTERVAL)
+
+
+def _enable_eoc_polling(sensor):
+    """Make a BMP085 instance poll for end of conversion instead of sleeping the worst-case delay.
+
+    Adafruit_BMP sleeps a fixed 5-26 ms after triggering each conversion; polling the
+    start-of-conversion bit returns as soon as the data registers are ready.
+    """
+    device = sensor._device
+
+    def read_raw_temp():
+        device.write8(_BMP_CONTROL, _BMP_READ_TEMP_CMD)
+        _wait_for_conversion(device)
+        return device.readU16BE(_BMP_DATA)
+
+    def read_raw_pressure():
+        mode = sensor._mode
+        device.write8(_BMP_CONTROL, _BMP_READ_PRESSURE_CMD + (mode << 6))
+        _wait_for_conversion(device)
+        msb = device.readU8(_BMP_DATA)
+        lsb = device.readU8(_BMP_DATA + 1)
+        xlsb = device.readU8(_BMP_DATA + 2)
+        return ((msb << 16) + (lsb << 8) + xlsb) >> (8 - mode)
+
+    # read_temperature/read_pressure/read_altitude all go through these raw reads
+    sensor.read_raw_temp = read_raw_temp
+    sensor.read_raw_pressure = read_raw_pressure
+
+
 class BmpSensor(Sensor, EasyResource):
     # To enable debug-level logging, either run viam-server with the --debug option,
     # or configure your resource/machine to display debug logs.
     MODEL: ClassVar[Model] = Model(ModelFamily("edss", "rocket-sensors"), "bmp-sensor")
     # print('MODEL: ', Self.MODEL)
 
+    def __init__(self, name: str):
+        super().__init__(name)
+        # Serializes the worker-thread reads: each conversion is a multi-step
+        # write/poll/read sequence that a concurrent read would corrupt
+        self._lock = threading.Lock()
+
     @classmethod
     def new(
         cls, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
@@ -48,22 +107,28 @@ class BmpSensor(Sensor, EasyResource):
         fields = config.attributes.fields
 
         # Validate sea_level_pressure parameter if provided
-        if "sea_level_pressure" in fields:
-            if not(fields["sea_level_pressure"].HasField("number_value")):
+        value = fields.get("sea_level_pressure")
+        if value is not None:
+            if value.WhichOneof("kind") != "number_value":
                 raise ValueError("sea_level_pressure must be a valid number")
-            else:
-                sea_level_pressure = int(fields["sea_level_pressure"].number_value)
-                if sea_level_pressure <= 0:
-                    raise ValueError("sea_level_pressure must be a positive number")
+            if int(value.number_value) <= 0:
+                raise ValueError("sea_level_pressure must be a positive number")
+        
+        # Validate oversampling parameter if provided
+        value = fields.get("oversampling")
+        if value is not None:
+            if value.WhichOneof("kind") != "number_value":
+                raise ValueError("oversampling must be a valid number")
+            if value.number_value not in (0, 1, 2, 3):
+                raise ValueError("oversampling must be 0, 1, 2 or 3")
         
         # Validate units parameter if provided
-        if "units" in fields:
-            if not fields["units"].HasField("string_value"):
+        value = fields.get("units")
+        if value is not None:
+            if value.WhichOneof("kind") != "string_value":
                 raise ValueError("units must be a valid string")
-            else:
-                units = fields["units"].string_value.lower()
-                if units not in ["metric", "imperial"]:
-                    raise ValueError("units must be either 'metric' or 'imperial'")
+            if value.string_value.lower() not in ("metric", "imperial"):
+                raise ValueError("units must be either 'metric' or 'imperial'")
         
         return []
 
@@ -76,26 +141,82 @@ class BmpSensor(Sensor, EasyResource):
             config (ComponentConfig): The new configuration
             dependencies (Mapping[ResourceName, ResourceBase]): Any dependencies (both implicit and explicit)
         """
+        # Read the attributes straight from the config Struct fields
+        fields = config.attributes.fields
+        self.sea_level_pressure = int(fields["sea_level_pressure"].number_value) if "sea_level_pressure" in fields else 101325  # Default sea level pressure in hPa*100
+        self.units = fields["units"].string_value.lower() if "units" in fields else "metric"  # Default to metric units
+        # Default to mode 0, ultra low power (single sample, no on-chip averaging): fastest
+        # conversion and lowest step-response lag, which is what tracking a rocket ascent needs
+        self.oversampling = int(fields["oversampling"].number_value) if "oversampling" in fields else 0
+
+        # Altitude is derived from the pressure reading, so sea level pressure is only divided once
+        self._inv_sea_level_pressure = 1.0 / self.sea_level_pressure
+
+        # Initialize tare offsets (default to 0 - no offset)
+        self.pressure_offset = 0.0
+        self.altitude_offset = 0.0
+
+        # Temperature drifts slowly, so it is only re-read once per interval (seconds)
+        # and the cached value is reused for the readings in between
+        self._temp_interval = 1.0
+        self._last_temp_ts = float("-inf")
+        self._cached_temp = 0.0
+
+        # Precompute unit conversion factors and reading keys once, so that
+        # get_readings does straight multiplies with no unit branching
+        if self.units == "imperial":
+            # (temp_scale, temp_offset, pressure_scale, altitude_scale): C to F, Pa to inHg, m to ft
+            self._conv = (9 / 5, 32.0, 0.0002953, 3.28084)
+            temp_unit, pressure_unit, altitude_unit = "F", "inHg", "ft"
+        else:  # metric (default)
+            self._conv = (1.0, 0.0, 1.0, 1.0)
+            temp_unit, pressure_unit, altitude_unit = "C", "Pa", "m"
+        self._keys = (
+            f"temperature - {temp_unit}",
+            f"pressure - {pressure_unit}",
+            f"altitude - {altitude_unit}",
+            f"sea_level_pressure - {pressure_unit}",
+            f"raw_pressure - {pressure_unit}",
+            f"raw_altitude - {altitude_unit}",
+            f"pressure_offset - {pressure_unit}",
+            f"altitude_offset - {altitude_unit}",
+        )
+        # Readings dict built once (sea level pressure only changes on reconfigure),
+        # get_readings only refreshes the changing values and copies it
+        self._reading_template = dict.fromkeys(self._keys, 0.0)
+        self._reading_template[self._keys[3]] = self.sea_level_pressure * self._conv[2]
+
+        # Initialize I2C and BMP sensor, the only part that touches the hardware
         try:
-            # Initialize I2C and BMP sensor
             i2c = busio.I2C(board.SCL, board.SDA)
-            self.sensor = BMP085.BMP085(busnum=1)
-            
-            attrs = struct_to_dict(config.attributes)
-            self.sea_level_pressure = int(attrs.get("sea_level_pressure", 101325))  # Default sea level pressure in hPa*100
-            self.units = attrs.get("units", "metric").lower()  # Default to metric units
-            
-            # Initialize tare offsets (default to 0 - no offset)
-            self.pressure_offset = 0.0
-            self.altitude_offset = 0.0
-
+            self.sensor = BMP085.BMP085(mode=self.oversampling, busnum=1)
+            _enable_eoc_polling(self.sensor)
         except Exception as e:
-            self.logger.error(f"Failed to initialize BMP sensor: {e}")
+            self.logger.error("Failed to initialize BMP sensor: %s", e)
             self.sensor = None
             raise
  
         return super().reconfigure(config, dependencies)
 
+    def _read_sensor(self):
+        """Blocking read of (temperature, pressure, altitude), refreshing the temperature at most once per interval."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_temp_ts >= self._temp_interval:
+                self._cached_temp = self.sensor.read_temperature()
+                self._last_temp_ts = now
+            pressure = self.sensor.read_pressure()
+        return self._cached_temp, pressure, self._altitude(pressure)
+
+    def _read_pressure(self):
+        """Blocking pressure read in Pa."""
+        with self._lock:
+            return self.sensor.read_pressure()
+
+    def _altitude(self, pressure):
+        """Altitude in meters for a pressure in Pa, without the extra pressure conversion read_altitude does."""
+        return _ALTITUDE_SCALE * (1.0 - (pressure * self._inv_sea_level_pressure) ** _ALTITUDE_EXPONENT)
+
     async def get_readings(
         self,
         *,
@@ -103,75 +224,34 @@ class BmpSensor(Sensor, EasyResource):
         timeout: Optional[float] = None,
         **kwargs
     ) -> Mapping[str, SensorReading]:
-        if self.sensor:
-            try:
-                # Read sensor data
-                temperature = self.sensor.read_temperature()
-                raw_pressure = self.sensor.read_pressure()
-                raw_altitude = self.sensor.read_altitude(self.sea_level_pressure)
-                
-                # Apply tare offsets (always applied, defaults to 0)
-                pressure = raw_pressure - self.pressure_offset
-                altitude = raw_altitude - self.altitude_offset
-                
-                # Convert units based on configuration
-                if self.units == "imperial":
-                    # Convert temperature from Celsius to Fahrenheit
-                    temperature_display = (temperature * 9/5) + 32
-                    temp_unit = "F"
-                    
-                    # Convert pressure from Pa to inHg (inches of mercury)
-                    pressure_display = pressure * 0.0002953  # Pa to inHg
-                    pressure_unit = "inHg"
-                    
-                    # Convert altitude from meters to feet
-                    altitude_display = altitude * 3.28084  # meters to feet
-                    altitude_unit = "ft"
-                    
-                    # Convert sea level pressure
-                    sea_level_display = self.sea_level_pressure * 0.0002953
-                    sea_level_unit = "inHg"
-                    
-                    # Convert raw values
-                    raw_pressure_display = raw_pressure * 0.0002953
-                    raw_altitude_display = raw_altitude * 3.28084
-                    
-                    # Convert offsets
-                    pressure_offset_display = self.pressure_offset * 0.0002953
-                    altitude_offset_display = self.altitude_offset * 3.28084
-                else:  # metric (default)
-                    temperature_display = temperature
-                    temp_unit = "C"
-                    pressure_display = pressure
-                    pressure_unit = "Pa"
-                    altitude_display = altitude
-                    altitude_unit = "m"
-                    sea_level_display = self.sea_level_pressure
-                    sea_level_unit = "Pa"
-                    raw_pressure_display = raw_pressure
-                    raw_altitude_display = raw_altitude
-                    pressure_offset_display = self.pressure_offset
-                    altitude_offset_display = self.altitude_offset
-                
-                readings = {
-                    f"temperature - {temp_unit}": float(temperature_display),
-                    f"pressure - {pressure_unit}": float(pressure_display),
-                    f"altitude - {altitude_unit}": float(altitude_display),
-                    f"sea_level_pressure - {sea_level_unit}": float(sea_level_display),
-                    f"raw_pressure - {pressure_unit}": float(raw_pressure_display),
-                    f"raw_altitude - {altitude_unit}": float(raw_altitude_display),
-                    f"pressure_offset - {pressure_unit}": float(pressure_offset_display),
-                    f"altitude_offset - {altitude_unit}": float(altitude_offset_display),
-                }
-                
-                return readings
-            except Exception as e:
-                self.logger.error(f"Error reading sensor data: {e}")
-                return {}
-        else:
+        if not self.sensor:
             self.logger.error("Sensor not initialized")
             return {}
 
+        try:
+            # Read sensor data off the event loop, the I2C conversions block
+            temperature, raw_pressure, raw_altitude = await asyncio.to_thread(self._read_sensor)
+        except OSError as e:
+            # I2C bus errors and end-of-conversion timeouts
+            self.logger.error("Error reading sensor data: %s", e)
+            return {}
+
+        # Apply tare offsets (always applied, defaults to 0) and convert units
+        ts, to, ps, als = self._conv
+        keys = self._keys
+        readings = self._reading_template
+        # The conversion factors are floats, so every product is already a float
+        # (including the int pressure from read_pressure) and needs no float() cast
+        readings[keys[0]] = temperature * ts + to
+        readings[keys[1]] = (raw_pressure - self.pressure_offset) * ps
+        readings[keys[2]] = (raw_altitude - self.altitude_offset) * als
+        readings[keys[4]] = raw_pressure * ps
+        readings[keys[5]] = raw_altitude * als
+        readings[keys[6]] = self.pressure_offset * ps
+        readings[keys[7]] = self.altitude_offset * als
+
+        return readings.copy()
+
     async def tare(self):
         """Tare the BMP sensor by setting the current readings as baseline offsets."""
         if not self.sensor:
@@ -181,12 +261,12 @@ class BmpSensor(Sensor, EasyResource):
         try:
             self.logger.debug("Taring BMP sensor")
             # Read current values and set as baseline (offset = 0)
-            self.pressure_offset = self.sensor.read_pressure()
-            self.altitude_offset = self.sensor.read_altitude(self.sea_level_pressure)
+            self.pressure_offset = await asyncio.to_thread(self._read_pressure)
+            self.altitude_offset = self._altitude(self.pressure_offset)
             
-            self.logger.info(f"Tare set - Pressure baseline: {self.pressure_offset:.2f} Pa, Altitude baseline: {self.altitude_offset:.2f} m")
+            self.logger.info("Tare set - Pressure baseline: %.2f Pa, Altitude baseline: %.2f m", self.pressure_offset, self.altitude_offset)
         except Exception as e:
-            self.logger.error(f"Error during tare operation: {e}")
+            self.logger.error("Error during tare operation: %s", e)
             raise
 
     async def reset_tare(self):
@@ -197,9 +277,26 @@ class BmpSensor(Sensor, EasyResource):
             self.altitude_offset = 0.0
             self.logger.info("Tare reset - returning to raw readings")
         except Exception as e:
-            self.logger.error(f"Error during reset tare operation: {e}")
+            self.logger.error("Error during reset tare operation: %s", e)
             raise
 
+    async def _handle_tare(self, args):
+        await self.tare()
+        return {
+            "pressure_offset": float(self.pressure_offset),
+            "altitude_offset": float(self.altitude_offset)
+        }
+
+    async def _handle_reset_tare(self, args):
+        await self.reset_tare()
+        return True
+
+    # do_command name -> handler(self, args)
+    _COMMANDS = {
+        "tare": _handle_tare,
+        "reset_tare": _handle_reset_tare,
+    }
+
     async def do_command(
         self,
         command: Mapping[str, ValueTypes],
@@ -207,22 +304,16 @@ class BmpSensor(Sensor, EasyResource):
         timeout: Optional[float] = None,
         **kwargs,
     ) -> Mapping[str, ValueTypes]:
-        result = {key: False for key in command.keys()}
+        result = {}
         for name, args in command.items():
-            if name == "tare":
-                await self.tare(*args)
-                result[name] = {
-                    "pressure_offset": float(self.pressure_offset),
-                    "altitude_offset": float(self.altitude_offset)
-                }
-            elif name == "reset_tare":
-                await self.reset_tare(*args)
-                result[name] = True
-            else:
+            handler = self._COMMANDS.get(name)
+            if handler is None:
                 result[name] = {
                     "error": f"Unknown command: {name}",
-                    "available_commands": ["tare", "reset_tare"]
+                    "available_commands": list(self._COMMANDS)
                 }
+            else:
+                result[name] = await handler(self, args)
         return result
 
 
@@ -1,7 +1,13 @@
 """HX711 Load Cell sensor model implementation."""
 
+import asyncio
+import collections
+import os
+import threading
+import time
 from typing import Any, ClassVar, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 from typing_extensions import Self
 from viam.components.sensor import Sensor
 from viam.proto.app.robot import ComponentConfig
@@ -9,61 +15,114 @@ from viam.proto.common import ResourceName
 from viam.resource.base import ResourceBase
 from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
-from viam.utils import SensorReading, struct_to_dict, ValueTypes
+from viam.utils import SensorReading, ValueTypes
 
 # Handle RPi.GPIO import for non-Raspberry Pi systems (like GitHub Actions)
 # This must be done BEFORE importing hx711, as hx711 also imports RPi.GPIO
 try:
     import RPi.GPIO as GPIO
 except ImportError:
-    # Create a comprehensive mock GPIO module for non-Raspberry Pi systems
-    class MockGPIO:
-        # GPIO constants
-        OUT = 0
-        IN = 1
-        HIGH = 1
-        LOW = 0
-        BCM = 11
-        BOARD = 10
-
-        @staticmethod
-        def cleanup(pins=None):
-            pass  # No-op for testing/CI environments
-
-        @staticmethod
-        def setup(pin, mode, initial=None):
-            pass  # No-op for testing/CI environments
-
-        @staticmethod
-        def output(pin, value):
-            pass  # No-op for testing/CI environments
-
-        @staticmethod
-        def input(pin):
-            return 0  # Return 0 for testing/CI environments
-
-        @staticmethod
-        def setmode(mode):
-            pass  # No-op for testing/CI environments
-
-        @staticmethod
-        def setwarnings(flag):
-            pass  # No-op for testing/CI environments
-
-        @staticmethod
-        def getmode():
-            return MockGPIO.BCM  # Return BCM mode for testing/CI environments
-
-    GPIO = MockGPIO
-    # Mock RPi.GPIO at the module level so hx711 can import it
+    # Lightweight no-op GPIO stand-in for non-Raspberry Pi systems, only built
+    # when the real library is missing
     import sys
+    import types
 
-    sys.modules["RPi"] = type(sys)("RPi")
+    GPIO = types.SimpleNamespace(
+        # GPIO constants
+        OUT=0,
+        IN=1,
+        HIGH=1,
+        LOW=0,
+        BCM=11,
+        BOARD=10,
+        # No-op functions for testing/CI environments
+        cleanup=lambda pins=None: None,
+        setup=lambda pin, mode, initial=None: None,
+        output=lambda pin, value: None,
+        input=lambda pin: 0,
+        setmode=lambda mode: None,
+        setwarnings=lambda flag: None,
+        getmode=lambda: 11,  # BCM mode
+    )
+    # Mock RPi.GPIO at the module level so hx711 can import it
+    rpi = types.ModuleType("RPi")
+    rpi.GPIO = GPIO
+    sys.modules["RPi"] = rpi
     sys.modules["RPi.GPIO"] = GPIO
 
 from hx711 import HX711
 
 
+def _number(value, error: str) -> float:
+    """Return the number held by a protobuf Value, raising ValueError(error) if it is not a number."""
+    if value.WhichOneof("kind") != "number_value":
+        raise ValueError(error)
+    return value.number_value
+
+
+def _check_gain(value) -> None:
+    # Gain must be 32, 64, or 128
+    if _number(value, "Gain must be a valid number.") not in (32, 64, 128):
+        raise ValueError("Gain must be 32, 64, or 128.")
+
+
+def _pin_validator(label: str):
+    """Build a validator for a GPIO pin attribute (1-40 for Raspberry Pi)."""
+
+    def _check_pin(value) -> None:
+        pin = int(_number(value, f"{label} must be a valid number."))
+        if not (1 <= pin <= 40):
+            raise ValueError(f"{label} must be a valid GPIO pin number (1-40).")
+
+    return _check_pin
+
+
+def _check_number_of_readings(value) -> None:
+    # Number of readings must be a positive integer less than 100
+    num_readings = int(_number(value, "Number of readings must be a valid number."))
+    if not (1 <= num_readings < 100):
+        raise ValueError("Number of readings must be a positive integer less than 100.")
+
+
+def _check_tare_offset(value) -> None:
+    # Tare offset must be a non-positive floating point value
+    if _number(value, "Tare offset must be a valid number.") > 0:
+        raise ValueError(
+            "Tare offset must be a non-positive floating point value (≤ 0.0)."
+        )
+
+
+def _check_continuous_sampling(value) -> None:
+    if value.WhichOneof("kind") != "bool_value":
+        raise ValueError("Continuous sampling must be a boolean.")
+
+
+# Validators for the (all optional) configuration attributes, in validation order
+_VALIDATORS = (
+    ("gain", _check_gain),
+    ("doutPin", _pin_validator("Data Out pin")),
+    ("sckPin", _pin_validator("Clock pin")),
+    ("numberOfReadings", _check_number_of_readings),
+    ("tare_offset", _check_tare_offset),
+    ("continuous_sampling", _check_continuous_sampling),
+)
+
+# Number of raw samples kept by the background sampler (more than the 99 readings maximum)
+_RING_SIZE = 128
+# Samples the sampler reads per call, the hx711 driver's get_raw_data minimum (min_measures)
+_SAMPLER_BATCH = 2
+# HX711 default output rate, used to bound how long to wait for sampler data
+_HX711_SAMPLES_PER_SECOND = 10
+# Extra time allowed for the sampler to deliver its first samples after starting (seconds)
+_SAMPLER_STARTUP = 1.0
+# Samples older than a few conversion periods are stale: the sampler is failing or stuck
+_SAMPLE_MAX_AGE = 5 / _HX711_SAMPLES_PER_SECOND  # seconds
+# How long to wait for the sampler thread to stop; the driver can block in a read forever
+_SAMPLER_JOIN_TIMEOUT = 2.0  # seconds
+# Real-time priority for the sampler thread, low in the 1-99 SCHED_FIFO range so kernel threads still win
+_SAMPLER_FIFO_PRIORITY = 10
+
+
 class LoadCell(Sensor, EasyResource):
     """HX711 Load Cell sensor implementation."""
 
@@ -77,99 +136,181 @@ class LoadCell(Sensor, EasyResource):
     ) -> Self:
         return super().new(config, dependencies)
 
+    def __init__(self, name: str):
+        super().__init__(name)
+        # Created in reconfigure, so the read path never has to check the attribute exists
+        self.hx711 = None
+        self._sampler = None
+        # Serializes the worker-thread HX711 reads: the driver bit-bangs the
+        # DOUT/SCK pins with no locking of its own
+        self._lock = threading.Lock()
+
     @classmethod
     def validate_config(cls, config: ComponentConfig) -> Tuple[Sequence[str], Sequence[str]]:
         fields = config.attributes.fields
         errors = []
 
-        # Validate gain: must be 32, 64, or 128 (OPTIONAL)
-        if "gain" in fields:
-            if not fields["gain"].HasField("number_value"):
-                errors.append("Gain must be a valid number.")
-            else:
-                gain = fields["gain"].number_value
-                if gain not in [32, 64, 128]:
-                    errors.append("Gain must be 32, 64, or 128.")
-
-        # Validate doutPin: must be a valid GPIO pin number (1-40 for Raspberry Pi) (OPTIONAL)
-        if "doutPin" in fields:
-            if not fields["doutPin"].HasField("number_value"):
-                errors.append("Data Out pin must be a valid number.")
-            else:
-                dout_pin = int(fields["doutPin"].number_value)
-                if not (1 <= dout_pin <= 40):
-                    errors.append(
-                        "Data Out pin must be a valid GPIO pin number (1-40)."
-                    )
-
-        # Validate sckPin: must be a valid GPIO pin number (1-40 for Raspberry Pi) (OPTIONAL)
-        if "sckPin" in fields:
-            if not fields["sckPin"].HasField("number_value"):
-                errors.append("Clock pin must be a valid number.")
-            else:
-                sck_pin = int(fields["sckPin"].number_value)
-                if not (1 <= sck_pin <= 40):
-                    errors.append("Clock pin must be a valid GPIO pin number (1-40).")
-
-        # Validate numberOfReadings: must be positive integer less than 100 (OPTIONAL)
-        if "numberOfReadings" in fields:
-            if not fields["numberOfReadings"].HasField("number_value"):
-                errors.append("Number of readings must be a valid number.")
-            else:
-                num_readings = int(fields["numberOfReadings"].number_value)
-                if not (1 <= num_readings < 100):
-                    errors.append(
-                        "Number of readings must be a positive integer less than 100."
-                    )
-
-        # Validate tare_offset: must be a non-positive floating point value (OPTIONAL)
-        if "tare_offset" in fields:
-            if not fields["tare_offset"].HasField("number_value"):
-                errors.append("Tare offset must be a valid number.")
-            else:
-                tare_offset = fields["tare_offset"].number_value
-                if tare_offset > 0:
-                    errors.append(
-                        "Tare offset must be a non-positive floating point value (≤ 0.0)."
-                    )
+        for name, check in _VALIDATORS:
+            value = fields.get(name)
+            if value is not None:
+                try:
+                    check(value)
+                except ValueError as e:
+                    errors.append(str(e))
 
         # If there are validation errors, raise an exception with all errors
         if errors:
             raise Exception("; ".join(errors))
 
-        return [], ["gain", "doutPin", "sckPin", "numberOfReadings", "tare_offset"]
+        # No dependencies: the attributes are plain settings, not resource names
+        return [], []
 
     def reconfigure(
         self,
         config: ComponentConfig,
         dependencies: Mapping[ResourceName, ResourceBase],
     ):
-        attrs = struct_to_dict(config.attributes)
-        self.gain = float(attrs.get("gain", 64))
-        self.doutPin = int(attrs.get("doutPin", 5))
-        self.sckPin = int(attrs.get("sckPin", 6))
-        self.numberOfReadings = int(attrs.get("numberOfReadings", 3))
-        self.tare_offset = float(attrs.get("tare_offset", 0.0))
+        # Read the attributes straight from the config Struct fields
+        fields = config.attributes.fields
+        self.gain = fields["gain"].number_value if "gain" in fields else 64.0
+        self.doutPin = int(fields["doutPin"].number_value) if "doutPin" in fields else 5
+        self.sckPin = int(fields["sckPin"].number_value) if "sckPin" in fields else 6
+        self.numberOfReadings = (
+            int(fields["numberOfReadings"].number_value)
+            if "numberOfReadings" in fields
+            else 3
+        )
+        self.tare_offset = (
+            fields["tare_offset"].number_value if "tare_offset" in fields else 0.0
+        )
+        self.continuous_sampling = (
+            fields["continuous_sampling"].bool_value
+            if "continuous_sampling" in fields
+            else False
+        )
+        # Raw counts to kg factor (assuming 8200 ~ 1kg), cached so no divide runs per reading
+        self._inv_scale = 1.0 / 8200.0
+        # Readings dict built once, get_readings only refreshes the changing values and copies it
+        self._reading_template = {
+            "doutPin": self.doutPin,
+            "sckPin": self.sckPin,
+            "gain": self.gain,
+            "numberOfReadings": self.numberOfReadings,
+            "tare_offset": 0.0,
+            "measures": [],
+            "weight": 0.0,
+        }
+
+        # Stop any running sampler before the HX711 settings change under it
+        self._stop_sampler()
 
         self.logger.debug(
-            f"Reconfigured with gain {self.gain}, doutPin {self.doutPin}, "
-            f"sckPin {self.sckPin}, numberOfReadings {self.numberOfReadings}, "
-            f"tare_offset {self.tare_offset}"
+            "Reconfigured with gain %s, doutPin %s, sckPin %s, numberOfReadings %s, tare_offset %s",
+            self.gain, self.doutPin, self.sckPin, self.numberOfReadings, self.tare_offset,
         )
 
-        # Initialize HX711 object if not already done
-        if not hasattr(self, "hx711") or self.hx711 is None:
-            self.hx711 = None
-            self.get_hx711()
+        # (Re)create the HX711 with the current pins and gain, outside the read path
+        self._drop_hx711()
+        self.get_hx711()
+
+        if self.continuous_sampling:
+            self._start_sampler()
 
         return super().reconfigure(config, dependencies)
 
+    def _start_sampler(self):
+        """Start the background thread that continuously reads the HX711 into a ring buffer."""
+        self._ring = collections.deque(maxlen=_RING_SIZE)
+        # monotonic time of the newest samples in the ring
+        self._last_sample_ts = float("-inf")
+        self._sampler_stop = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._pump, name=f"hx711-sampler-{self.name}", daemon=True
+        )
+        self._sampler.start()
+        self.logger.debug("Started continuous HX711 sampling")
+
+    def _stop_sampler(self):
+        """Stop the background sampler thread, if running, and wait for it to exit."""
+        sampler = self._sampler
+        self._sampler = None
+        if sampler is not None:
+            self._sampler_stop.set()
+            sampler.join(_SAMPLER_JOIN_TIMEOUT)
+            if sampler.is_alive():
+                # hx711 get_raw_data retries forever while DOUT is disconnected or stuck high
+                self.logger.warning("HX711 sampler thread did not stop, it is stuck reading the HX711")
+            else:
+                self.logger.debug("Stopped continuous HX711 sampling")
+
+    def _pin_sampler_thread(self):
+        """Pin the calling thread to the last CPU and give it SCHED_FIFO priority.
+
+        Keeps the bit-banged HX711 reads from being preempted mid-transfer. Needs
+        CAP_SYS_NICE (or root) for the priority; without it sampling still runs
+        with the default scheduling.
+        """
+        try:
+            # pid 0 is the calling thread on Linux
+            cpus = os.sched_getaffinity(0)
+            if len(cpus) < 2:
+                return  # a busy real-time thread on the only core would starve the event loop
+            os.sched_setaffinity(0, {max(cpus)})
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_SAMPLER_FIFO_PRIORITY))
+        except (AttributeError, OSError) as e:
+            # AttributeError: not Linux; PermissionError: missing CAP_SYS_NICE
+            self.logger.debug("Could not raise HX711 sampler thread priority: %s", e)
+
+    def _pump(self):
+        """Sampler thread body: append raw HX711 samples to the ring until stopped.
+
+        Owns the HX711 while running: the async read paths leave it alone, and
+        reconfigure and close stop the sampler before releasing it.
+        """
+        self._pin_sampler_thread()
+        while not self._sampler_stop.is_set():
+            try:
+                self._ring.extend(self.get_hx711().get_raw_data(times=_SAMPLER_BATCH))
+                self._last_sample_ts = time.monotonic()
+            except Exception as e:
+                self.logger.warning("Error reading HX711 in sampler thread: %s", e)
+                # Drop the samples from before the error, so readings wait for fresh ones,
+                # and back off before retrying with the same HX711
+                self._ring.clear()
+                self._sampler_stop.wait(0.1)
+
+    async def _read_measures(self):
+        """Return the latest numberOfReadings raw samples from the HX711."""
+        if self._sampler is None:
+            hx711 = self.hx711
+            if hx711 is None:  # dropped after a read error, recreate it
+                hx711 = self.get_hx711()
+            # HX711 reads are bit-banged over GPIO and block, so run them off the event loop
+            return await asyncio.to_thread(self._read_raw_data, hx711)
+
+        # Continuous sampling: snapshot the newest samples, waiting for the ring to hold
+        # enough fresh ones (after start, or while the sampler recovers from errors)
+        deadline = time.monotonic() + _SAMPLER_STARTUP + self.numberOfReadings / _HX711_SAMPLES_PER_SECOND
+        while True:
+            now = time.monotonic()
+            if len(self._ring) >= self.numberOfReadings and now - self._last_sample_ts <= _SAMPLE_MAX_AGE:
+                return list(self._ring)[-self.numberOfReadings:]
+            if now > deadline:
+                raise TimeoutError("HX711 sampler did not produce enough fresh samples")
+            await asyncio.sleep(0.01)
+
+    def _read_raw_data(self, hx711):
+        """Blocking read of numberOfReadings raw samples, one read on the pins at a time."""
+        with self._lock:
+            return hx711.get_raw_data(times=self.numberOfReadings)
+
     def get_hx711(self):
         """Get the HX711 instance, creating it if necessary."""
         if self.hx711 is None:
             try:
                 self.logger.debug(
-                    f"Initializing HX711 with doutPin {self.doutPin}, sckPin {self.sckPin}, gain {self.gain}"
+                    "Initializing HX711 with doutPin %s, sckPin %s, gain %s",
+                    self.doutPin, self.sckPin, self.gain,
                 )
                 self.hx711 = HX711(
                     dout_pin=self.doutPin,
@@ -181,39 +322,43 @@ class LoadCell(Sensor, EasyResource):
                 self.hx711.reset()
                 self.logger.debug("HX711 initialized and reset successfully")
             except Exception as e:
-                self.logger.error(f"Failed to initialize HX711: {e}")
-                # Clean up the failed object
-                if hasattr(self, "hx711") and self.hx711 is not None:
-                    try:
-                        del self.hx711
-                    except Exception as cleanup_error:
-                        self.logger.warning(
-                            f"Error cleaning up failed HX711 object: {cleanup_error}"
-                        )
+                self.logger.error("Failed to initialize HX711: %s", e)
+                # Drop the failed object
                 self.hx711 = None
                 raise
         return self.hx711
 
+    def _drop_hx711(self):
+        """Power down and release the HX711 explicitly, rather than leaving it to the garbage collector."""
+        # Under the read lock, so the HX711 is never powered down mid-read
+        with self._lock:
+            hx711 = self.hx711
+            self.hx711 = None
+            if hx711 is not None:
+                try:
+                    hx711.power_down()
+                except Exception as e:
+                    self.logger.warning("Error powering down HX711: %s", e)
+
     def cleanup_gpio_pins(self):
         """Clean up only the specific GPIO pins used by this sensor."""
         try:
-            self.logger.debug(f"Cleaning up GPIO pins {self.doutPin}, {self.sckPin}")
+            self.logger.debug("Cleaning up GPIO pins %s, %s", self.doutPin, self.sckPin)
             GPIO.cleanup((self.doutPin, self.sckPin))
         except Exception as e:
             self.logger.warning(
-                f"Error cleaning up GPIO pins {self.doutPin}, {self.sckPin}: {e}"
+                "Error cleaning up GPIO pins %s, %s: %s", self.doutPin, self.sckPin, e
             )
 
     def close(self):
         """Clean up resources when the component is closed."""
         try:
-            if hasattr(self, "hx711") and self.hx711 is not None:
-                del self.hx711
-                self.hx711 = None
+            self._stop_sampler()
+            self._drop_hx711()
             self.cleanup_gpio_pins()
             self.logger.debug("Load cell component closed and resources cleaned up")
         except Exception as e:
-            self.logger.warning(f"Error during component cleanup: {e}")
+            self.logger.warning("Error during component cleanup: %s", e)
 
     async def get_readings(
         self,
@@ -223,62 +368,56 @@ class LoadCell(Sensor, EasyResource):
         **kwargs,
     ) -> Mapping[str, SensorReading]:
 
+        self.logger.debug("Getting readings from load cell")
         try:
-            self.logger.debug("Getting readings from load cell")
-            hx711 = self.get_hx711()
-            measures = hx711.get_raw_data(times=self.numberOfReadings)
-            # Convert each measure to kgs by subtracting tare offset and dividing by 8200
-            measures_kg = [(measure - self.tare_offset) / 8200 for measure in measures]
-            avg_kgs = sum(measures_kg) / len(
-                measures_kg
-            )  # Assuming 8200 ~ 1kg, then this converts to kg
-
-            # Return a dictionary of the readings
-            return {
-                "doutPin": self.doutPin,
-                "sckPin": self.sckPin,
-                "gain": self.gain,
-                "numberOfReadings": self.numberOfReadings,
-                "tare_offset": self.tare_offset
-                / 8200,  # reporting tare value in kgs for consistency with readings
-                "measures": measures_kg,  # Now returning measures in kg
-                "weight": avg_kgs,
-            }
+            measures = await self._read_measures()
         except Exception as e:
-            self.logger.error(f"Error getting readings from load cell: {e}")
-            # If there's an error, clean up and reset the HX711 object for next time
-            if hasattr(self, "hx711") and self.hx711 is not None:
-                try:
-                    del self.hx711
-                except Exception as cleanup_error:
-                    self.logger.warning(
-                        f"Error cleaning up HX711 object after reading error: {cleanup_error}"
-                    )
-            self.hx711 = None
+            self.logger.error("Error getting readings from load cell: %s", e)
+            # If there's an error, drop the HX711 object so it is recreated next time;
+            # while sampling, the sampler thread owns it and recovers on its own
+            if self._sampler is None:
+                # power_down writes the pins and sleeps, so keep it off the event loop
+                await asyncio.to_thread(self._drop_hx711)
             raise
 
+        # Convert all measures to kgs in one vectorized pass: subtract tare offset and scale
+        kg = (np.asarray(measures, dtype=np.float64) - self.tare_offset) * self._inv_scale
+
+        # Return a copy of the readings template with the current values filled in
+        readings = self._reading_template
+        readings["tare_offset"] = (
+            self.tare_offset * self._inv_scale
+        )  # reporting tare value in kgs for consistency with readings
+        readings["measures"] = kg.tolist()  # Now returning measures in kg
+        readings["weight"] = float(kg.mean())
+        return readings.copy()
+
     async def tare(self):
         """Tare the load cell by setting the current reading as the zero offset."""
 
         try:
             self.logger.debug("Taring load cell")
-            hx711 = self.get_hx711()
-            measures = hx711.get_raw_data(times=self.numberOfReadings)
-            self.tare_offset = sum(measures) / len(measures)  # Set tare offset
-            self.logger.debug(f"Tare completed. New offset: {self.tare_offset}")
+            measures = await self._read_measures()
+            self.tare_offset = float(np.asarray(measures, dtype=np.float64).mean())  # Set tare offset
+            self.logger.debug("Tare completed. New offset: %s", self.tare_offset)
         except Exception as e:
-            self.logger.error(f"Error during tare operation: {e}")
-            # If there's an error, clean up and reset the HX711 object for next time
-            if hasattr(self, "hx711") and self.hx711 is not None:
-                try:
-                    del self.hx711
-                except Exception as cleanup_error:
-                    self.logger.warning(
-                        f"Error cleaning up HX711 object after tare error: {cleanup_error}"
-                    )
-            self.hx711 = None
+            self.logger.error("Error during tare operation: %s", e)
+            # If there's an error, drop the HX711 object so it is recreated next time;
+            # while sampling, the sampler thread owns it and recovers on its own
+            if self._sampler is None:
+                # power_down writes the pins and sleeps, so keep it off the event loop
+                await asyncio.to_thread(self._drop_hx711)
             raise
 
+    async def _handle_tare(self, args):
+        await self.tare()
+        return self.tare_offset * self._inv_scale
+
+    # do_command name -> handler(self, args)
+    _COMMANDS = {
+        "tare": _handle_tare,
+    }
+
     async def do_command(
         self,
         command: Mapping[str, ValueTypes],
@@ -286,9 +425,14 @@ class LoadCell(Sensor, EasyResource):
         timeout: Optional[float] = None,
         **kwargs,
     ) -> Mapping[str, ValueTypes]:
-        result = {key: False for key in command.keys()}
+        result = {}
         for name, args in command.items():
-            if name == "tare":
-                await self.tare(*args)
-                result[name] = self.tare_offset / 8200
+            handler = self._COMMANDS.get(name)
+            if handler is None:
+                result[name] = {
+                    "error": f"Unknown command: {name}",
+                    "available_commands": list(self._COMMANDS),
+                }
+            else:
+                result[name] = await handler(self, args)
         return result
@@ -1,3 +1,6 @@
+import asyncio
+import math
+import time
 from typing import (Any, ClassVar, Dict, Final, List, Mapping, Optional,
                     Sequence, Tuple)
 
@@ -8,18 +11,186 @@ from viam.proto.common import Geometry, ResourceName
 from viam.resource.base import ResourceBase
 from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
-from viam.utils import SensorReading, ValueTypes, struct_to_dict
+from viam.utils import SensorReading, ValueTypes
 
+import numpy as np
 import board
 import busio
 import adafruit_mpu6050
 
+try:
+    import numba
+except ImportError:  # optional, get_readings falls back to NumPy without it
+    numba = None
+
+# MPU-6050 ACCEL_XOUT_H: accel X/Y/Z, temperature and gyro X/Y/Z follow as 7 contiguous
+# big-endian int16 registers (0x3B-0x48), so one 14-byte burst read returns a full sample.
+# All per-sample vectors below are in this register order.
+_MPU_SAMPLE_REGISTER = bytes([0x3B])
+_MPU_SAMPLE_DTYPE = np.dtype(">i2")
+_MPU_SAMPLE_SIZE = 7 * _MPU_SAMPLE_DTYPE.itemsize
+# Raw to SI scale factors for the ranges set in reconfigure, same constants as adafruit_mpu6050
+_ACCEL_SCALE = adafruit_mpu6050.STANDARD_GRAVITY / 8192.0  # +/-4 g: LSB to m/s²
+_GYRO_SCALE = math.radians(1.0 / 65.5)  # +/-500 deg/s: LSB to rad/s
+_TEMP_SCALE = 1.0 / 340.0  # LSB to degrees C
+_TEMP_OFFSET = 36.53  # degrees C
+_SI_SCALE = np.array([_ACCEL_SCALE] * 3 + [_TEMP_SCALE] + [_GYRO_SCALE] * 3)
+_SI_BIAS = np.array([0.0] * 3 + [_TEMP_OFFSET] + [0.0] * 3)
+_ZEROS = np.zeros(7)
+_ONES = np.ones(7)
+# Tare offset attribute names and their index in the offsets vector (3 is temperature, never tared)
+_TARE_OFFSETS = (
+    ("accel_x_offset", 0), ("accel_y_offset", 1), ("accel_z_offset", 2),
+    ("gyro_x_offset", 4), ("gyro_y_offset", 5), ("gyro_z_offset", 6),
+)
+# Reading keys per unit system
+_METRIC_KEYS = (
+    "acceleration_x - m/s²", "acceleration_y - m/s²", "acceleration_z - m/s²",
+    "temperature - C",
+    "gyro_x - rad/s", "gyro_y - rad/s", "gyro_z - rad/s",
+)
+_IMPERIAL_KEYS = (
+    "acceleration_x - ft/s²", "acceleration_y - ft/s²", "acceleration_z - ft/s²",
+    "temperature - F",
+    "gyro_x - deg/s", "gyro_y - deg/s", "gyro_z - deg/s",
+)
+# With the digital low pass filter enabled the gyro output rate is 1 kHz, and the
+# sample rate is that divided by (1 + SMPLRT_DIV)
+_GYRO_OUTPUT_RATE = 1000  # Hz
+# On-chip FIFO: FIFO_EN bits for temperature, gyro X/Y/Z and accel, which the chip then
+# queues in the same accel/temperature/gyro order as the sample registers
+_MPU_FIFO_EN = bytes([0x23, 0xF8])
+_MPU_FIFO_DATA_REGISTER = bytes([0x74])  # FIFO_R_W
+_MPU_FIFO_SIZE = 1024  # bytes
+_MAX_BATCH = _MPU_FIFO_SIZE // _MPU_SAMPLE_SIZE  # whole samples that fit in the FIFO
+# CONFIG register: EXT_SYNC_SET in bits 5:3 (left 0, FSYNC disabled) and DLPF_CFG in bits 2:0
+_MPU_CONFIG_REGISTER = 0x1A
+# DLPF bandwidths (Hz) and their DLPF_CFG values, widest first; 260 Hz (0) is left out
+# as it turns the filter off
+_DLPF_BANDWIDTHS = (
+    (184, 1),
+    (94, 2),
+    (44, 3),
+    (21, 4),
+    (10, 5),
+    (5, 6),
+)
+
+
+def _convert_sample_loop(buf, si_scale, si_bias, offsets, unit_scale, unit_bias, out):
+    """Decode the 14 sample bytes and write the offset, unit converted values into out.
+
+    Written as a plain loop over scalars so Numba can compile it to a single native pass.
+    """
+    for i in range(7):
+        raw = (int(buf[2 * i]) << 8) | int(buf[2 * i + 1])  # widen from uint8 before shifting
+        if raw >= 0x8000:  # two's complement int16
+            raw -= 0x10000
+        out[i] = (raw * si_scale[i] + si_bias[i] - offsets[i]) * unit_scale[i] + unit_bias[i]
+
+
+def _convert_sample_numpy(buf, si_scale, si_bias, offsets, unit_scale, unit_bias, out):
+    """NumPy equivalent of _convert_sample_loop, used when Numba is not installed."""
+    np.multiply(buf.view(_MPU_SAMPLE_DTYPE), si_scale, out=out)
+    out += si_bias
+    out -= offsets
+    out *= unit_scale
+    out += unit_bias
+
+
+if numba is not None:
+    # Explicit signature: compiled once at import (and cached on disk), not on the first reading
+    _convert_sample = numba.njit(
+        "void(uint8[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])",
+        cache=True,
+        fastmath=True,
+    )(_convert_sample_loop)
+else:
+    _convert_sample = _convert_sample_numpy
+
+
+def _number(value, error: str) -> float:
+    """Return the number held by a protobuf Value, raising ValueError(error) if it is not a number."""
+    if value.WhichOneof("kind") != "number_value":
+        raise ValueError(error)
+    return value.number_value
+
+
+def _check_i2c_address(value) -> None:
+    i2c_address = int(_number(value, "i2c_address must be a valid number."))
+    if not (0x08 <= i2c_address <= 0x77):
+        raise ValueError("i2c_address must be a valid I2C address (0x08-0x77)")
+
+
+def _check_units(value) -> None:
+    if value.WhichOneof("kind") != "string_value":
+        raise ValueError("units must be a valid string.")
+    if value.string_value.lower() not in ("metric", "imperial"):
+        raise ValueError("units must be either 'metric' or 'imperial'")
+
+
+def _check_sample_rate(value) -> None:
+    sample_rate = int(_number(value, "sample_rate must be a valid number."))
+    if sample_rate <= 0:
+        raise ValueError("sample_rate must be a positive number")
+    if sample_rate > _GYRO_OUTPUT_RATE:
+        raise ValueError(f"sample_rate must be at most {_GYRO_OUTPUT_RATE} Hz")
+
+
+def _sample_rate_divisor(sample_rate: int) -> int:
+    """SMPLRT_DIV register value giving the closest rate to sample_rate."""
+    return min(255, max(0, round(_GYRO_OUTPUT_RATE / sample_rate) - 1))
+
+
+def _dlpf_config(sample_rate: int) -> int:
+    """DLPF_CFG value for the widest bandwidth that stays under the Nyquist frequency of sample_rate."""
+    for bandwidth, setting in _DLPF_BANDWIDTHS:
+        if bandwidth <= sample_rate / 2:
+            return setting
+    return _DLPF_BANDWIDTHS[-1][1]
+
+
+def _offset_validator(name: str):
+    """Build a validator for a tare offset attribute, which must be a number."""
+
+    def _check_offset(value) -> None:
+        _number(value, f"{name} must be a valid number (float).")
+
+    return _check_offset
+
+
+# Validators for the (all optional) configuration attributes, in validation order
+_VALIDATORS = (
+    ("i2c_address", _check_i2c_address),
+    ("units", _check_units),
+    ("sample_rate", _check_sample_rate),
+) + tuple((name, _offset_validator(name)) for name, _ in _TARE_OFFSETS)
+
+
+def _offset_property(index):
+    """Expose one entry of the tare offsets vector as a float attribute."""
+    def fget(self):
+        return float(self._offsets[index])
+
+    def fset(self, value):
+        self._offsets[index] = value
+
+    return property(fget, fset)
+
 
 class Mpu(Sensor, EasyResource):
     # To enable debug-level logging, either run viam-server with the --debug option,
     # or configure your resource/machine to display debug logs.
     MODEL: ClassVar[Model] = Model(ModelFamily("edss", "rocket-sensors"), "mpu-sensor")
 
+    # Tare offsets in SI units, backed by the offsets vector subtracted from each sample
+    accel_x_offset = _offset_property(0)
+    accel_y_offset = _offset_property(1)
+    accel_z_offset = _offset_property(2)
+    gyro_x_offset = _offset_property(4)
+    gyro_y_offset = _offset_property(5)
+    gyro_z_offset = _offset_property(6)
+
     @classmethod
     def new(
         cls, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
@@ -50,53 +221,19 @@ class Mpu(Sensor, EasyResource):
         fields = config.attributes.fields
         errors = []
 
-        # Validate i2c_address parameter (OPTIONAL)
-        if "i2c_address" in fields:
-            if not fields["i2c_address"].HasField("number_value"):
-                errors.append("i2c_address must be a valid number.")
-            else:
-                i2c_address = int(fields["i2c_address"].number_value)
-                if not (0x08 <= i2c_address <= 0x77):
-                    errors.append("i2c_address must be a valid I2C address (0x08-0x77)")
-        
-        # Validate units parameter (OPTIONAL)
-        if "units" in fields:
-            if not fields["units"].HasField("string_value"):
-                errors.append("units must be a valid string.")
-            else:
-                units = fields["units"].string_value.lower()
-                if units not in ["metric", "imperial"]:
-                    errors.append("units must be either 'metric' or 'imperial'")
-        
-        # Validate sample_rate parameter (OPTIONAL)
-        if "sample_rate" in fields:
-            if not fields["sample_rate"].HasField("number_value"):
-                errors.append("sample_rate must be a valid number.")
-            else:
-                sample_rate = int(fields["sample_rate"].number_value)
-                if sample_rate <= 0:
-                    errors.append("sample_rate must be a positive number")
-        
-        # Validate optional offset parameters (if provided, must be floats)
-        optional_offsets = ["accel_x_offset", "accel_y_offset", "accel_z_offset", 
-                           "gyro_x_offset", "gyro_y_offset", "gyro_z_offset"]
-        
-        for offset_param in optional_offsets:
-            if offset_param in fields:
-                if not fields[offset_param].HasField("number_value"):
-                    errors.append(f"{offset_param} must be a valid number (float).")
-                else:
-                    # Verify it's a float by checking if it can be converted to float
-                    try:
-                        float(fields[offset_param].number_value)
-                    except (ValueError, TypeError):
-                        errors.append(f"{offset_param} must be a valid float value.")
-        
+        for name, check in _VALIDATORS:
+            value = fields.get(name)
+            if value is not None:
+                try:
+                    check(value)
+                except ValueError as e:
+                    errors.append(str(e))
+
         # If there are validation errors, raise an exception with all errors
         if errors:
             raise Exception("; ".join(errors))
-        
-        return [], ["i2c_address", "units", "sample_rate"] + optional_offsets  # Return (required_dependencies, optional_dependencies)
+
+        return [], []  # Return (required_dependencies, optional_dependencies), this model has none
 
     def reconfigure(
         self, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
@@ -108,37 +245,77 @@ class Mpu(Sensor, EasyResource):
             dependencies (Mapping[ResourceName, ResourceBase]): Any dependencies (both implicit and explicit)
         """
         try:
-            # Initialize I2C and MPU sensor
-            i2c = busio.I2C(board.SCL, board.SDA)
+            # Read the attributes straight from the config Struct fields
+            fields = config.attributes.fields
+            self.i2c_address = int(fields["i2c_address"].number_value) if "i2c_address" in fields else 0x68  # Default MPU6050 address
+            self.units = fields["units"].string_value.lower() if "units" in fields else "metric"  # Default to metric units
+            self.sample_rate = int(fields["sample_rate"].number_value) if "sample_rate" in fields else 100  # Default 100Hz sample rate
             
-            attrs = struct_to_dict(config.attributes)
-            self.i2c_address = int(attrs.get("i2c_address", 0x68))  # Default MPU6050 address
-            self.units = attrs.get("units", "metric").lower()  # Default to metric units
-            self.sample_rate = int(attrs.get("sample_rate", 100))  # Default 100Hz sample rate
-            
-            # Initialize MPU sensor
+            # Initialize I2C and MPU sensor. On Linux the kernel driver owns the bus
+            # clock (see the README), busio cannot set it
+            i2c = busio.I2C(board.SCL, board.SDA)
             self.sensor = adafruit_mpu6050.MPU6050(i2c, address=self.i2c_address)
             
             # Configure sensor settings
             self.sensor.accelerometer_range = adafruit_mpu6050.Range.RANGE_4_G
             self.sensor.gyro_range = adafruit_mpu6050.GyroRange.RANGE_500_DPS
+            # Have the chip produce samples at the configured rate, low pass filtered below
+            # half that rate, so polls do not re-read stale or aliased samples
+            sample_rate_divisor = _sample_rate_divisor(self.sample_rate)
+            # Written straight to CONFIG: adafruit_mpu6050's filter_bandwidth property sets
+            # the EXT_SYNC_SET bits instead of DLPF_CFG, which leaves the filter off and
+            # latches FSYNC into the sample registers
+            with self.sensor.i2c_device as i2c:
+                i2c.write(bytes([_MPU_CONFIG_REGISTER, _dlpf_config(self.sample_rate)]))
+            self.sensor.sample_rate_divisor = sample_rate_divisor
+            # Time between fresh samples; pollers should wait this long between reads
+            self._period = (1 + sample_rate_divisor) / _GYRO_OUTPUT_RATE
+            # Receive buffer for the burst read of a whole sample, a byte view of it for
+            # the conversion helper and the output vector it writes into
+            self._sample_buffer = bytearray(_MPU_SAMPLE_SIZE)
+            self._sample_bytes = np.frombuffer(self._sample_buffer, dtype=np.uint8)
+            self._values = np.empty(7)
+
+            # Precompute unit conversion vectors and reading keys once, so that
+            # get_readings is one vectorized expression with no unit branching
+            if self.units == "imperial":
+                # (accel_scale, gyro_scale, temp_scale, temp_offset): m/s² to ft/s², rad/s to deg/s, C to F
+                accel_scale, gyro_scale, temp_scale, temp_offset = (3.28084, 57.2958, 9 / 5, 32.0)
+                self._keys = _IMPERIAL_KEYS
+            else:  # metric (default)
+                accel_scale, gyro_scale, temp_scale, temp_offset = (1.0, 1.0, 1.0, 0.0)
+                self._keys = _METRIC_KEYS
+            self._unit_scale = np.array([accel_scale] * 3 + [temp_scale] + [gyro_scale] * 3)
+            self._unit_bias = np.array([0.0] * 3 + [temp_offset] + [0.0] * 3)
+            # Readings dict built once, get_readings only refreshes the values and copies it
+            self._reading_template = dict.fromkeys(self._keys, 0.0)
             
-            # Initialize tare offsets (default to 0 - no offset)
-            self.accel_x_offset = 0.0
-            self.accel_y_offset = 0.0
-            self.accel_z_offset = 0.0
-            self.gyro_x_offset = 0.0
-            self.gyro_y_offset = 0.0
-            self.gyro_z_offset = 0.0
+            # Initialize tare offsets (default to 0 - no offset), temperature is never tared
+            self._offsets = np.zeros(7)
+
+            # FIFO is only switched on by the first get_batch call
+            self._fifo_enabled = False
+            self._batch_buffer = bytearray(_MAX_BATCH * _MPU_SAMPLE_SIZE)
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize IMU sensor: {e}")
-            self.logger.error(f"Error: {e}")
+            self.logger.error("Failed to initialize IMU sensor: %s", e)
             self.sensor = None
             raise
  
         return super().reconfigure(config, dependencies)
 
+    def _read_raw(self):
+        """Burst-read a whole sample into the receive buffer in a single I2C transaction."""
+        with self.sensor.i2c_device as i2c:
+            i2c.write_then_readinto(_MPU_SAMPLE_REGISTER, self._sample_buffer)
+
+    def _read_sample(self):
+        """Read a sample in SI units, without tare offsets: accel (m/s²), temperature (C), gyro (rad/s)."""
+        self._read_raw()
+        sample = np.empty(7)
+        _convert_sample(self._sample_bytes, _SI_SCALE, _SI_BIAS, _ZEROS, _ONES, _ZEROS, sample)
+        return sample
+
     async def get_readings(
         self,
         *,
@@ -148,73 +325,89 @@ class Mpu(Sensor, EasyResource):
     ) -> Mapping[str, SensorReading]:
         if self.sensor:
             try:
-                # Read sensor data
-                acceleration = self.sensor.acceleration  # (x, y, z) in m/s²
-                gyro = self.sensor.gyro  # (x, y, z) in rad/s
-                temperature = self.sensor.temperature  # in Celsius
-                
-                # Apply tare offsets (always applied, defaults to 0)
-                accel_x = acceleration[0] - self.accel_x_offset
-                accel_y = acceleration[1] - self.accel_y_offset
-                accel_z = acceleration[2] - self.accel_z_offset
-                
-                gyro_x = gyro[0] - self.gyro_x_offset
-                gyro_y = gyro[1] - self.gyro_y_offset
-                gyro_z = gyro[2] - self.gyro_z_offset
+                values = self._values
+                readings = self._reading_template
+                self._read_raw()
                 
-                # Convert units based on configuration
-                if self.units == "imperial":
-                    # Convert acceleration from m/s² to ft/s²
-                    accel_x_display = accel_x * 3.28084
-                    accel_y_display = accel_y * 3.28084
-                    accel_z_display = accel_z * 3.28084
-                    accel_unit = "ft/s²"
-                    
-                    # Convert gyro from rad/s to deg/s
-                    gyro_x_display = gyro_x * 57.2958  # rad to deg
-                    gyro_y_display = gyro_y * 57.2958
-                    gyro_z_display = gyro_z * 57.2958
-                    gyro_unit = "deg/s"
-                    
-                    # Convert temperature from Celsius to Fahrenheit
-                    temp_display = (temperature * 9/5) + 32
-                    temp_unit = "F"
-                else:  # metric (default)
-                    accel_x_display = accel_x
-                    accel_y_display = accel_y
-                    accel_z_display = accel_z
-                    accel_unit = "m/s²"
-                    gyro_x_display = gyro_x
-                    gyro_y_display = gyro_y
-                    gyro_z_display = gyro_z
-                    gyro_unit = "rad/s"
-                    temp_display = temperature
-                    temp_unit = "C"
-                
-                # Core MPU readings - 3 acceleration + 3 rotation speed + temperature
-                readings = {
-                    # 3-axis acceleration readings
-                    f"acceleration_x - {accel_unit}": float(accel_x_display),
-                    f"acceleration_y - {accel_unit}": float(accel_y_display),
-                    f"acceleration_z - {accel_unit}": float(accel_z_display),
-                    
-                    # 3-axis gyroscope (rotation speed) readings
-                    f"gyro_x - {gyro_unit}": float(gyro_x_display),
-                    f"gyro_y - {gyro_unit}": float(gyro_y_display),
-                    f"gyro_z - {gyro_unit}": float(gyro_z_display),
-                    
-                    # Temperature reading
-                    f"temperature - {temp_unit}": float(temp_display),
-                }
-                
-                return readings
+                # Decode, apply tare offsets (always applied, defaults to 0) and convert units, all axes at once
+                _convert_sample(
+                    self._sample_bytes, _SI_SCALE, _SI_BIAS,
+                    self._offsets, self._unit_scale, self._unit_bias, values,
+                )
+                readings.update(zip(self._keys, values.tolist()))
+
+                return readings.copy()
             except Exception as e:
-                self.logger.error(f"Error reading sensor data: {e}")
+                self.logger.error("Error reading sensor data: %s", e)
                 return {}
         else:
             self.logger.error("Sensor not initialized")
             return {}
 
+    def _enable_fifo(self):
+        """Route accel, temperature and gyro samples into the on-chip FIFO, starting from empty."""
+        with self.sensor.i2c_device as i2c:
+            i2c.write(_MPU_FIFO_EN)
+        self._reset_fifo()
+        self._fifo_enabled = True
+
+    def _reset_fifo(self):
+        """Empty the FIFO and (re)start it.
+
+        FIFO_EN is cleared before the reset, as the register map requires, so a
+        reset cannot leave the FIFO misaligned in the middle of a sample frame.
+        """
+        sensor = self.sensor
+        sensor.fifo_en = False
+        sensor.fiforst = True
+        sensor.fifo_en = True
+
+    def _drain_fifo(self, n):
+        """Burst-read the n oldest samples from the FIFO into the batch buffer in one I2C transaction."""
+        with self.sensor.i2c_device as i2c:
+            i2c.write_then_readinto(
+                _MPU_FIFO_DATA_REGISTER, self._batch_buffer, in_end=n * _MPU_SAMPLE_SIZE
+            )
+
+    async def get_batch(self, n: int) -> Mapping[str, List[float]]:
+        """Read the next n samples (1-73) the chip queued in its FIFO, with one burst read.
+
+        The first call enables the FIFO, so it waits n sample periods. Later calls
+        return consecutive samples, as long as they come before the 1024 byte FIFO
+        overflows (1024 / 14 samples at the configured sample rate).
+
+        Returns:
+            Mapping[str, List[float]]: The n values for each reading key, oldest first
+        """
+        if not self.sensor:
+            self.logger.error("Sensor not initialized")
+            raise RuntimeError("Sensor not initialized")
+        if not (1 <= n <= _MAX_BATCH):
+            raise ValueError(f"Batch size must be between 1 and {_MAX_BATCH} samples")
+
+        if not self._fifo_enabled:
+            self._enable_fifo()
+
+        needed = n * _MPU_SAMPLE_SIZE
+        deadline = time.monotonic() + 1.0 + n * self._period
+        while True:
+            count = self.sensor.fifo_count
+            if count >= _MPU_FIFO_SIZE:
+                # Overflowed: the oldest bytes were dropped and the sample framing is lost
+                self.logger.warning("MPU FIFO overflowed, resetting it")
+                self._reset_fifo()
+            elif count >= needed:
+                break
+            if time.monotonic() > deadline:
+                raise TimeoutError("MPU FIFO did not collect enough samples")
+            await asyncio.sleep(self._period)
+
+        await asyncio.to_thread(self._drain_fifo, n)
+
+        raw = np.frombuffer(self._batch_buffer, dtype=_MPU_SAMPLE_DTYPE, count=n * 7).reshape(n, 7)
+        values = (raw * _SI_SCALE + _SI_BIAS - self._offsets) * self._unit_scale + self._unit_bias
+        return dict(zip(self._keys, values.T.tolist()))
+
     async def tare(self):
         """Tare the IMU sensor by setting the current readings as baseline offsets."""
         if not self.sensor:
@@ -224,37 +417,48 @@ class Mpu(Sensor, EasyResource):
         try:
             self.logger.debug("Taring IMU sensor")
             # Read current values and set as baseline (offset = 0)
-            acceleration = self.sensor.acceleration
-            gyro = self.sensor.gyro
-            
-            self.accel_x_offset = acceleration[0]
-            self.accel_y_offset = acceleration[1]
-            self.accel_z_offset = acceleration[2]
-            self.gyro_x_offset = gyro[0]
-            self.gyro_y_offset = gyro[1]
-            self.gyro_z_offset = gyro[2]
+            sample = self._read_sample()
+            sample[3] = 0.0  # leave temperature untared
+            self._offsets[:] = sample
             
-            self.logger.info(f"Tare set - Accel baseline: ({self.accel_x_offset:.3f}, {self.accel_y_offset:.3f}, {self.accel_z_offset:.3f}) m/s²")
-            self.logger.info(f"Tare set - Gyro baseline: ({self.gyro_x_offset:.3f}, {self.gyro_y_offset:.3f}, {self.gyro_z_offset:.3f}) rad/s")
+            accel_x, accel_y, accel_z, _, gyro_x, gyro_y, gyro_z = sample.tolist()
+            logger = self.logger
+            logger.info("Tare set - Accel baseline: (%.3f, %.3f, %.3f) m/s²", accel_x, accel_y, accel_z)
+            logger.info("Tare set - Gyro baseline: (%.3f, %.3f, %.3f) rad/s", gyro_x, gyro_y, gyro_z)
         except Exception as e:
-            self.logger.error(f"Error during tare operation: {e}")
+            self.logger.error("Error during tare operation: %s", e)
             raise
 
     async def reset_tare(self):
         """Reset tare offsets to zero."""
         try:
             self.logger.debug("Resetting tare offsets")
-            self.accel_x_offset = 0.0
-            self.accel_y_offset = 0.0
-            self.accel_z_offset = 0.0
-            self.gyro_x_offset = 0.0
-            self.gyro_y_offset = 0.0
-            self.gyro_z_offset = 0.0
+            self._offsets.fill(0.0)
             self.logger.info("Tare reset - returning to raw readings")
         except Exception as e:
-            self.logger.error(f"Error during reset tare operation: {e}")
+            self.logger.error("Error during reset tare operation: %s", e)
             raise
 
+    async def _handle_tare(self, args):
+        await self.tare()
+        offsets = self._offsets.tolist()
+        return {offset: offsets[index] for offset, index in _TARE_OFFSETS}
+
+    async def _handle_reset_tare(self, args):
+        await self.reset_tare()
+        return "reset successful"
+
+    async def _handle_get_batch(self, args):
+        # args is the batch size, a protobuf number (so a float)
+        return await self.get_batch(int(args))
+
+    # do_command name -> handler(self, args)
+    _COMMANDS = {
+        "tare": _handle_tare,
+        "reset_tare": _handle_reset_tare,
+        "get_batch": _handle_get_batch,
+    }
+
     async def do_command(
         self,
         command: Mapping[str, ValueTypes],
@@ -262,24 +466,14 @@ class Mpu(Sensor, EasyResource):
         timeout: Optional[float] = None,
         **kwargs,
     ) -> Mapping[str, ValueTypes]:
-        result = {key: False for key in command.keys()}
+        result = {}
         for name, args in command.items():
-            if name == "tare":
-                await self.tare(*args)
-                result[name] = {
-                    "accel_x_offset": float(self.accel_x_offset),
-                    "accel_y_offset": float(self.accel_y_offset),
-                    "accel_z_offset": float(self.accel_z_offset),
-                    "gyro_x_offset": float(self.gyro_x_offset),
-                    "gyro_y_offset": float(self.gyro_y_offset),
-                    "gyro_z_offset": float(self.gyro_z_offset)
-                }
-            elif name == "reset_tare":
-                await self.reset_tare(*args)
-                result[name] = "reset successful"
-            else:
+            handler = self._COMMANDS.get(name)
+            if handler is None:
                 result[name] = {
                     "error": f"Unknown command: {name}",
-                    "available_commands": ["tare", "reset_tare"]
+                    "available_commands": list(self._COMMANDS)
                 }
-        return result
\ No newline at end of file
+            else:
+                result[name] = await handler(self, args)
+        return result
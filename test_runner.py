@@ -4,28 +4,57 @@
 import sys
 import subprocess
 import argparse
-from pathlib import Path
+import concurrent.futures
+import threading
 
+MODULES = ["loadcell", "mpu", "bmp"]
+
+# Keeps the output blocks of concurrently run commands from interleaving
+_print_lock = threading.Lock()
+
+
+def run_command(cmd, description, buffered=False):
+    """Run a command and handle errors.
+    
+    With buffered, the command's output is collected and printed in one block once it
+    finishes, instead of streamed live, so concurrent commands don't interleave.
+    """
+    header = f"\n{'='*60}\nRunning: {description}\nCommand: {' '.join(cmd)}\n{'='*60}"
+    
+    if buffered:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        output = [header, result.stdout.rstrip()]
+    else:
+        print(header)
+        # Let the child write straight to our stdout/stderr so progress shows live
+        sys.stdout.flush()
+        result = subprocess.run(cmd)
+        output = []
+    
+    if result.returncode != 0:
+        output.append(f"❌ {description} failed with return code {result.returncode}")
+        success = False
+    else:
+        output.append(f"✅ {description} completed successfully")
+        success = True
+    with _print_lock:
+        print("\n".join(output))
+    return success
+
+
+def run_pytest(pytest_args, description):
+    """Run pytest in the current interpreter, streaming its output live."""
+    import pytest
 
-def run_command(cmd, description):
-    """Run a command and handle errors."""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
-    print(f"Command: {' '.join(cmd)}")
+    print(f"Command: pytest {' '.join(pytest_args)}")
     print(f"{'='*60}")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.stdout:
-        print("STDOUT:")
-        print(result.stdout)
-    
-    if result.stderr:
-        print("STDERR:")
-        print(result.stderr)
+    returncode = pytest.main(pytest_args)
     
-    if result.returncode != 0:
-        print(f"❌ {description} failed with return code {result.returncode}")
+    if returncode != 0:
+        print(f"❌ {description} failed with return code {returncode}")
         return False
     else:
         print(f"✅ {description} completed successfully")
@@ -48,43 +77,53 @@ def run_linting():
     return all_passed
 
 
-def run_module_tests(module, test_type, coverage, verbose, hardware):
-    """Run tests for a specific module using the proper Viam testing approach."""
-    # Base pytest command
-    cmd = ["python", "-m", "pytest"]
+def build_pytest_args(target, test_type, coverage, verbose, hardware, workers=None):
+    """Build the pytest arguments shared by in-process and per-module runs."""
+    pytest_args = []
     
     # Add verbosity
     if verbose:
-        cmd.append("-v")
+        pytest_args.append("-v")
+    
+    # Spread the tests over pytest-xdist workers, keeping each file on one worker
+    # so its fixtures are set up once
+    if workers:
+        pytest_args.extend(["-n", workers, "--dist", "loadfile"])
     
     # Add coverage if requested
     if coverage:
-        cmd.extend(["--cov=src", "--cov-report=html", "--cov-report=xml"])
+        pytest_args.extend(["--cov=src", "--cov-report=html", "--cov-report=xml"])
     
     # Select module and test files
-    cmd.append(f"tests/{module}/")
+    pytest_args.append(target)
     
     # Select test type
     if test_type == "unit":
-        cmd.extend(["-m", "unit"])
+        pytest_args.extend(["-m", "unit"])
     elif test_type == "integration":
-        cmd.extend(["-m", "integration"])
+        pytest_args.extend(["-m", "integration"])
     elif test_type == "all":
         if not hardware:
-            cmd.extend(["-m", "not hardware"])
+            pytest_args.extend(["-m", "not hardware"])
     
     # Add hardware tests if requested
     if hardware:
-        cmd.extend(["-m", "hardware"])
+        pytest_args.extend(["-m", "hardware"])
     
-    # Run the tests
-    return run_command(cmd, f"Testing {module} module ({test_type} tests)")
+    return pytest_args
+
+
+def run_module_tests(module, test_type, coverage, verbose, hardware, buffered=False):
+    """Run tests for a specific module using the proper Viam testing approach."""
+    cmd = ["python", "-m", "pytest"]
+    cmd.extend(build_pytest_args(f"tests/{module}/", test_type, coverage, verbose, hardware))
+    return run_command(cmd, f"Testing {module} module ({test_type} tests)", buffered)
 
 
 def main():
     """Main test runner function."""
     parser = argparse.ArgumentParser(description="Run tests for rocket-sensors project")
-    parser.add_argument("--module", choices=["loadcell", "mpu", "bmp", "all"], 
+    parser.add_argument("--module", choices=MODULES + ["all"], 
                        default="all", help="Which module to test")
     parser.add_argument("--type", choices=["unit", "integration", "all"], 
                        default="all", help="Which type of tests to run")
@@ -96,9 +135,22 @@ def main():
                        help="Include hardware-dependent tests")
     parser.add_argument("--lint", action="store_true", 
                        help="Run linting checks")
+    parser.add_argument("--workers", "-n", metavar="N",
+                       help="Run tests on N pytest-xdist workers ('auto' for one per CPU)")
+    parser.add_argument("--parallel", action="store_true", 
+                       help="With --module all, test each module in its own pytest process concurrently")
     
     args = parser.parse_args()
-    
+
+    # --parallel runs one pytest process per module, which --workers would only oversubscribe
+    if args.parallel and args.workers:
+        parser.error("--parallel and --workers cannot be used together")
+    if args.parallel and args.module != "all":
+        parser.error("--parallel needs --module all")
+    # The per-module processes would all write the same .coverage file and reports
+    if args.parallel and args.coverage:
+        parser.error("--parallel and --coverage cannot be used together")
+
     # Handle linting option
     if args.lint:
         success = run_linting()
@@ -109,38 +161,29 @@ def main():
             sys.exit(1)
         return
     
-    # Base pytest command
-    cmd = ["python", "-m", "pytest"]
-    
-    # Add verbosity
-    if args.verbose:
-        cmd.append("-v")
-    
-    # Add coverage if requested
-    if args.coverage:
-        cmd.extend(["--cov=src", "--cov-report=html", "--cov-report=xml"])
-    
-    # Select module and test files - use proper Viam approach
-    if args.module == "all":
-        cmd.append("tests/")  # Run all tests in single process with session-scoped registration
-    else:
-        cmd.append(f"tests/{args.module}/")
-    
-    # Select test type
-    if args.type == "unit":
-        cmd.extend(["-m", "unit"])
-    elif args.type == "integration":
-        cmd.extend(["-m", "integration"])
-    elif args.type == "all":
-        if not args.hardware:
-            cmd.extend(["-m", "not hardware"])
+    # One pytest subprocess per module, run side by side; the processes share
+    # no Python state, so each gets its own registry
+    if args.parallel:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(MODULES)) as executor:
+            results = list(executor.map(
+                lambda module: run_module_tests(module, args.type, args.coverage, args.verbose, args.hardware, buffered=True),
+                MODULES,
+            ))
+        if all(results):
+            print(f"\n🎉 All tests passed!")
+        else:
+            print(f"\n💥 Some tests failed!")
+            sys.exit(1)
+        return
     
-    # Add hardware tests if requested
-    if args.hardware:
-        cmd.extend(["-m", "hardware"])
+    # Pytest arguments (pytest runs in-process, no extra interpreter startup)
+    # Select module and test files - use proper Viam approach: "all" runs every
+    # test in a single process with session-scoped registration
+    target = "tests/" if args.module == "all" else f"tests/{args.module}/"
+    pytest_args = build_pytest_args(target, args.type, args.coverage, args.verbose, args.hardware, args.workers)
     
     # Run the tests
-    success = run_command(cmd, f"Testing {args.module} module ({args.type} tests)")
+    success = run_pytest(pytest_args, f"Testing {args.module} module ({args.type} tests)")
     
     if success:
         print(f"\n🎉 All tests passed!")
@@ -1,110 +1,111 @@
 """Comprehensive BMP tests with proper mocking and async handling."""
 
 import pytest
-import asyncio
-from unittest.mock import Mock, patch, MagicMock
-from typing import Mapping, Any
 
-# BmpSensor is imported by the session-scoped fixture in conftest.py
-# No need to import here to avoid duplicate registration
+from models.bmp import BmpSensor
+from tests.fakes import FakeBMP085
+
+# validate_config cases, built once at collection
+VALID_CONFIGS = [
+    pytest.param({}, id="defaults"),
+    pytest.param({"sea_level_pressure": 101325, "units": "metric"}, id="metric"),
+    pytest.param({"sea_level_pressure": 101325, "units": "imperial", "oversampling": 3}, id="custom"),
+    pytest.param({"i2c_address": 0x100}, id="unvalidated-i2c-address"),  # BMP doesn't validate i2c_address
+]
+INVALID_CONFIGS = [
+    pytest.param({"oversampling": 5}, "oversampling must be 0, 1, 2 or 3", id="oversampling-range"),
+    pytest.param({"oversampling": "high"}, "oversampling must be a valid number", id="oversampling-type"),
+    pytest.param({"units": "fahrenheit"}, "units must be either 'metric' or 'imperial'", id="units-value"),
+    pytest.param({"units": 123}, "units must be a valid string", id="units-type"),
+    pytest.param({"sea_level_pressure": -100}, "sea_level_pressure must be a positive number", id="sea-level-pressure-range"),
+    pytest.param({"sea_level_pressure": "invalid"}, "sea_level_pressure must be a valid number", id="sea-level-pressure-type"),
+]
+
+# Reading keys for each unit system
+READING_KEYS = {
+    "metric": frozenset({
+        "temperature - C", "pressure - Pa", "altitude - m", "sea_level_pressure - Pa",
+        "raw_pressure - Pa", "raw_altitude - m", "pressure_offset - Pa", "altitude_offset - m",
+    }),
+    "imperial": frozenset({
+        "temperature - F", "pressure - inHg", "altitude - ft", "sea_level_pressure - inHg",
+        "raw_pressure - inHg", "raw_altitude - ft", "pressure_offset - inHg", "altitude_offset - ft",
+    }),
+}
+
+# Expected readings for 25°C and 100129 Pa (~100m above the default sea level pressure)
+EXPECTED_METRIC = {
+    "temperature - C": pytest.approx(25.0),
+    "pressure - Pa": pytest.approx(100129.0),
+    "altitude - m": pytest.approx(100.0, abs=0.1),
+    "sea_level_pressure - Pa": pytest.approx(101325.0),
+    "raw_pressure - Pa": pytest.approx(100129.0),
+    "raw_altitude - m": pytest.approx(100.0, abs=0.1),
+    "pressure_offset - Pa": 0.0,
+    "altitude_offset - m": 0.0,
+}
+EXPECTED_IMPERIAL = {
+    "temperature - F": pytest.approx(77.0),  # 25°C = 77°F
+    "pressure - inHg": pytest.approx(29.57, rel=1e-2),  # 100129 Pa ≈ 29.57 inHg
+    "altitude - ft": pytest.approx(328.084, abs=0.5),  # ~100m ≈ 328.084ft
+}
+# The same reading after taring 1000 Pa and 10 m
+EXPECTED_METRIC_TARED = {
+    "pressure - Pa": pytest.approx(99129.0),
+    "altitude - m": pytest.approx(90.0, abs=0.1),
+    "raw_pressure - Pa": pytest.approx(100129.0),
+    "raw_altitude - m": pytest.approx(100.0, abs=0.1),
+    "pressure_offset - Pa": pytest.approx(1000.0),
+    "altitude_offset - m": pytest.approx(10.0),
+}
 
 
 @pytest.mark.unit
 class TestBmpSensor:
     """Comprehensive BMP tests with proper mocking."""
     
-    def test_validation_valid_config(self, create_config_with_attributes):
-        """Test validation with valid configuration."""
-        config = create_config_with_attributes({
-            "sea_level_pressure": 101325,
-            "units": "metric"
-        })
+    @pytest.mark.parametrize("attributes", VALID_CONFIGS)
+    def test_validation_accepts(self, create_config_with_attributes, attributes):
+        """Test validation accepts valid configurations."""
         # BMP validate_config returns Sequence[str], not tuple
-        result = BmpSensor.validate_config(config)
-        assert result == []
+        assert BmpSensor.validate_config(create_config_with_attributes(attributes)) == []
     
-    def test_validation_invalid_oversampling(self, create_config_with_attributes):
-        """Test validation with invalid oversampling."""
-        # BMP doesn't validate oversampling, so this test should pass
-        config = create_config_with_attributes({"oversampling": 5})  # Invalid oversampling
-        result = BmpSensor.validate_config(config)
-        assert result == []
+    @pytest.mark.parametrize("attributes, error", INVALID_CONFIGS)
+    def test_validation_rejects(self, create_config_with_attributes, attributes, error):
+        """Test validation rejects invalid configurations."""
+        with pytest.raises(Exception, match=error):
+            BmpSensor.validate_config(create_config_with_attributes(attributes))
     
-    def test_validation_invalid_i2c_address(self, create_config_with_attributes):
-        """Test validation with invalid I2C address."""
-        # BMP doesn't validate i2c_address, so this test should pass
-        config = create_config_with_attributes({"i2c_address": 0x100})  # Invalid address
-        result = BmpSensor.validate_config(config)
-        assert result == []
-    
-    def test_validation_invalid_units(self, create_config_with_attributes):
-        """Test validation with invalid units."""
-        config = create_config_with_attributes({"units": "fahrenheit"})  # Invalid units
-        with pytest.raises(Exception, match="units must be either 'metric' or 'imperial'"):
-            BmpSensor.validate_config(config)
-    
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_initialization_defaults(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    def test_initialization_defaults(self, bmp):
         """Test initialization with default values."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
-        
         assert bmp.sea_level_pressure == 101325
         assert bmp.units == "metric"
+        assert bmp.oversampling == 0
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_initialization_custom_values(self, mock_bmp_class, mock_board, mock_busio, create_config_with_attributes, mock_dependencies):
+    def test_initialization_custom_values(self, bmp_mocks, make_bmp):
         """Test initialization with custom values."""
-        config = create_config_with_attributes({
+        bmp = make_bmp({
             "sea_level_pressure": 100000,
-            "units": "imperial"
+            "units": "imperial",
+            "oversampling": 3
         })
         
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(config, mock_dependencies)
-        
         assert bmp.sea_level_pressure == 100000
         assert bmp.units == "imperial"
+        assert bmp.oversampling == 3
+        bmp_mocks.bmp_class.BMP085.assert_called_once_with(mode=3, busnum=1)
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_bmp_creation(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    def test_bmp_creation(self, bmp_mocks, bmp):
         """Test BMP085 sensor creation."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
-        
         # Check I2C was created correctly
-        mock_busio.I2C.assert_called_once_with(mock_board.SCL, mock_board.SDA)
+        bmp_mocks.busio.I2C.assert_called_once_with(bmp_mocks.board.SCL, bmp_mocks.board.SDA)
         
         # Check BMP085 was created correctly
-        mock_bmp_class.BMP085.assert_called_once_with(busnum=1)
+        bmp_mocks.bmp_class.BMP085.assert_called_once_with(mode=0, busnum=1)
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_bmp_initialization_error(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    def test_bmp_initialization_error(self, bmp_mocks, mock_component_config, mock_dependencies):
         """Test BMP085 initialization error handling."""
-        mock_busio.I2C.side_effect = Exception("I2C not available")
+        bmp_mocks.busio.I2C.side_effect = Exception("I2C not available")
         
         bmp = BmpSensor("test-bmp")
         with pytest.raises(Exception, match="I2C not available"):
@@ -112,236 +113,210 @@ class TestBmpSensor:
         
         assert bmp.sensor is None
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_readings_success_metric(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
-        """Test successful sensor readings in metric units."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.read_temperature.return_value = 25.0  # °C
-        mock_bmp_instance.read_pressure.return_value = 101325.0  # Pa
-        mock_bmp_instance.read_altitude.return_value = 100.0  # m
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
+    def test_raw_reads_poll_end_of_conversion(self, bmp_mocks, mock_component_config, mock_dependencies):
+        """Test raw reads poll the start-of-conversion bit instead of sleeping."""
+        mock_bmp_instance = bmp_mocks.sensor
+        mock_bmp_instance._mode = 1
+        device = mock_bmp_instance._device
         
         bmp = BmpSensor("test-bmp")
         bmp.reconfigure(mock_component_config, mock_dependencies)
         
-        readings = asyncio.run(bmp.get_readings())
+        # Conversion busy for two polls, then complete
+        device.readU8.side_effect = [0x2E, 0x2E, 0x0E]
+        device.readU16BE.return_value = 27898
+        assert bmp.sensor.read_raw_temp() == 27898
+        device.write8.assert_called_with(0xF4, 0x2E)
+        assert device.readU8.call_count == 3
+        
+        # Pressure read polls, then reads the three data bytes
+        device.readU8.reset_mock()
+        device.readU8.side_effect = [0x74, 0x54, 0x5D, 0x23, 0x00]
+        assert bmp.sensor.read_raw_pressure() == ((0x5D << 16) + (0x23 << 8)) >> 7
+        device.write8.assert_called_with(0xF4, 0x34 + (1 << 6))
+    
+    @pytest.mark.parametrize("units, pressure_offset, altitude_offset, expected", [
+        ("metric", 0.0, 0.0, EXPECTED_METRIC),
+        ("imperial", 0.0, 0.0, EXPECTED_IMPERIAL),
+        ("metric", 1000.0, 10.0, EXPECTED_METRIC_TARED),
+    ])
+    async def test_readings_success(self, bmp_mocks, make_bmp, units, pressure_offset, altitude_offset, expected):
+        """Test successful sensor readings in metric and imperial units, with and without tare offsets."""
+        mock_bmp_instance = bmp_mocks.sensor
+        mock_bmp_instance.read_pressure.return_value = 100129.0  # Pa, ~100m above sea level
+        
+        bmp = make_bmp({"units": units})
+        bmp.pressure_offset = pressure_offset
+        bmp.altitude_offset = altitude_offset
+        
+        readings = await bmp.get_readings()
+        
+        assert readings.keys() == READING_KEYS[units]
+        assert {key: readings[key] for key in expected} == expected
+        # Altitude is computed from the pressure reading, without a second pressure conversion
+        mock_bmp_instance.read_altitude.assert_not_called()
+        assert mock_bmp_instance.read_pressure.call_count == 1
+    
+    @pytest.mark.parametrize("attributes, temperature, pressure, altitude_offset, key, expected", [
+        pytest.param({}, -40.0, 101325.0, 0.0, "temperature - C", -40.0, id="cold"),
+        pytest.param({"units": "imperial"}, -40.0, 101325.0, 0.0, "temperature - F", -40.0, id="cold-imperial"),
+        pytest.param({}, 85.0, 101325.0, 0.0, "temperature - C", 85.0, id="hot"),
+        pytest.param({}, 25.0, 102532.0, 0.0, "altitude - m", pytest.approx(-100.0, abs=0.5), id="below-sea-level"),
+        pytest.param({}, 25.0, 100129.0, 150.0, "altitude - m", pytest.approx(-50.0, abs=0.1), id="negative-after-offset"),
+    ])
+    async def test_readings_edge_cases(self, make_bmp, attributes, temperature, pressure, altitude_offset, key, expected):
+        """Test readings at the edges of the sensor range and with offsets above the current altitude."""
+        bmp = make_bmp(attributes, sensor=FakeBMP085(temperature=temperature, pressure=pressure))
+        bmp.altitude_offset = altitude_offset
+        
+        readings = await bmp.get_readings()
+        
+        assert readings[key] == expected
+    
+    async def test_readings_temperature_cached(self, bmp_mocks, bmp):
+        """Test temperature is only re-read once per interval."""
+        mock_bmp_instance = bmp_mocks.sensor
         
-        assert "temperature - C" in readings
-        assert "pressure - Pa" in readings
-        assert "altitude - m" in readings
-        assert "sea_level_pressure - Pa" in readings
-        assert "raw_pressure - Pa" in readings
-        assert "raw_altitude - m" in readings
-        assert "pressure_offset - Pa" in readings
-        assert "altitude_offset - m" in readings
+        await bmp.get_readings()
+        mock_bmp_instance.read_temperature.return_value = 30.0
+        readings = await bmp.get_readings()
         
-        # Check values in metric units
+        # Second reading within the interval reuses the cached temperature
+        assert mock_bmp_instance.read_temperature.call_count == 1
+        assert mock_bmp_instance.read_pressure.call_count == 2
         assert readings["temperature - C"] == 25.0
-        assert readings["pressure - Pa"] == 101325.0
-        assert readings["altitude - m"] == 100.0
-    
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_readings_success_imperial(self, mock_bmp_class, mock_board, mock_busio, create_config_with_attributes, mock_dependencies):
-        """Test successful sensor readings in imperial units."""
-        config = create_config_with_attributes({"units": "imperial"})
-        
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.read_temperature.return_value = 25.0  # °C (will be converted)
-        mock_bmp_instance.read_pressure.return_value = 101325.0  # Pa (will be converted)
-        mock_bmp_instance.read_altitude.return_value = 100.0  # m (will be converted)
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
         
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(config, mock_dependencies)
+        # Once the interval has elapsed the temperature is read again
+        bmp._last_temp_ts -= bmp._temp_interval
+        readings = await bmp.get_readings()
+        assert mock_bmp_instance.read_temperature.call_count == 2
+        assert readings["temperature - C"] == 30.0
+    
+    async def test_readings_are_independent_copies(self, bmp):
+        """Test each get_readings call returns its own dict, not the shared template."""
+        bmp.sensor = FakeBMP085(temperature=25.0, pressure=101325.0)
+        
+        first = await bmp.get_readings()
+        bmp.sensor.pressure = 90000.0
+        second = await bmp.get_readings()
+        
+        assert first is not second
+        assert first["pressure - Pa"] == 101325.0
+        assert second["pressure - Pa"] == 90000.0
+        assert second["sea_level_pressure - Pa"] == 101325.0
+    
+    async def test_readings_are_floats_for_int_pressure(self, bmp):
+        """Test the int pressure returned by the driver still comes out as float readings."""
+        bmp.sensor = FakeBMP085(temperature=25.0, pressure=101325)  # Adafruit_BMP returns an int
         
-        readings = asyncio.run(bmp.get_readings())
+        await bmp.tare()
+        readings = await bmp.get_readings()
         
-        # Check values in imperial units
-        assert readings["temperature - F"] == 77.0  # 25°C = 77°F
-        assert readings["pressure - inHg"] == pytest.approx(29.92, rel=1e-2)  # 101325 Pa ≈ 29.92 inHg
-        assert readings["altitude - ft"] == pytest.approx(328.084, abs=0.1)  # 100m ≈ 328.084ft
+        assert all(type(value) is float for value in readings.values())
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_readings_error_handling(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_readings_error_handling(self, bmp):
         """Test readings error handling."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.read_temperature.side_effect = Exception("Sensor error")
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
+        bmp.sensor = FakeBMP085(error=OSError("Sensor error"))
         
-        readings = asyncio.run(bmp.get_readings())
+        readings = await bmp.get_readings()
         assert readings == {}  # Error handling returns empty dict
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_tare_success(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
-        """Test successful tare operation."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.read_pressure.return_value = 101325.0  # Current pressure
-        mock_bmp_instance.read_altitude.return_value = 100.0  # Current altitude
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
+    async def test_reads_hold_device_lock(self, bmp_mocks, bmp):
+        """Test readings and tare only talk to the sensor while holding the device lock."""
+        mock_bmp_instance = bmp_mocks.sensor
+        mock_bmp_instance.read_temperature.side_effect = lambda: 25.0 if bmp._lock.locked() else None
+        mock_bmp_instance.read_pressure.side_effect = lambda: 100129.0 if bmp._lock.locked() else None
         
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
+        readings = await bmp.get_readings()
+        await bmp.tare()
+        
+        assert readings["temperature - C"] == 25.0
+        assert readings["raw_pressure - Pa"] == 100129.0
+        assert bmp.pressure_offset == 100129.0
+    
+    async def test_tare_success(self, bmp):
+        """Test successful tare operation."""
+        bmp.sensor = FakeBMP085(pressure=100129.0)  # Current pressure, ~100m
         
-        asyncio.run(bmp.tare())
+        await bmp.tare()
         
         # Tare offsets should be set
-        assert bmp.pressure_offset == 101325.0
-        assert bmp.altitude_offset == 100.0
+        assert bmp.pressure_offset == 100129.0
+        assert bmp.altitude_offset == pytest.approx(100.0, abs=0.1)
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_tare_error_handling(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_tare_error_handling(self, bmp):
         """Test tare error handling."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.read_pressure.side_effect = Exception("Tare error")
-        mock_bmp_instance.read_altitude.side_effect = Exception("Tare error")
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
+        bmp.sensor = FakeBMP085(error=Exception("Tare error"))
         
         with pytest.raises(Exception, match="Tare error"):
-            asyncio.run(bmp.tare())
+            await bmp.tare()
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_reset_tare(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_reset_tare(self, bmp):
         """Test reset tare operation."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.altitude = 100.0
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
-        
         # Set some tare offsets first
         bmp.pressure_offset = 1000.0
         bmp.altitude_offset = 50.0
         
-        asyncio.run(bmp.reset_tare())
+        await bmp.reset_tare()
         
         # Tare offsets should be reset
         assert bmp.pressure_offset == 0.0
         assert bmp.altitude_offset == 0.0
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_commands_tare(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_commands_tare(self, bmp):
         """Test tare command execution."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.read_pressure.return_value = 101325.0
-        mock_bmp_instance.read_altitude.return_value = 100.0
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
+        bmp.sensor = FakeBMP085(pressure=100129.0)
         
         command = {"tare": []}
-        result = asyncio.run(bmp.do_command(command))
+        result = await bmp.do_command(command)
         
         assert "tare" in result
         assert "pressure_offset" in result["tare"]
         assert "altitude_offset" in result["tare"]
-        assert result["tare"]["pressure_offset"] == 101325.0
-        assert result["tare"]["altitude_offset"] == 100.0
+        assert result["tare"]["pressure_offset"] == 100129.0
+        assert result["tare"]["altitude_offset"] == pytest.approx(100.0, abs=0.1)
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_commands_reset_tare(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_commands_reset_tare(self, bmp):
         """Test reset tare command execution."""
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
-        
         # Set some tare offsets first
         bmp.pressure_offset = 1000.0
         bmp.altitude_offset = 50.0
         
         command = {"reset_tare": []}
-        result = asyncio.run(bmp.do_command(command))
+        result = await bmp.do_command(command)
         
         assert "reset_tare" in result
         assert result["reset_tare"] == True
     
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_commands_unknown(self, mock_bmp_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_commands_unknown(self, bmp):
         """Test handling of unknown commands."""
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(mock_component_config, mock_dependencies)
-        
         command = {"unknown_command": []}
-        result = asyncio.run(bmp.do_command(command))
+        result = await bmp.do_command(command)
         
         assert "unknown_command" in result
         assert "error" in result["unknown_command"]
         assert "available_commands" in result["unknown_command"]
     
     @pytest.mark.integration
-    @patch('models.bmp.busio')
-    @patch('models.bmp.board')
-    @patch('models.bmp.BMP085')
-    def test_full_workflow(self, mock_bmp_class, mock_board, mock_busio, create_config_with_attributes, mock_dependencies):
+    async def test_full_workflow(self, make_bmp):
         """Test complete BMP workflow: configure, tare, read."""
-        config = create_config_with_attributes({
+        # Initialize and configure, reading the configured sea level pressure
+        bmp = make_bmp({
             "i2c_bus": 0,
             "i2c_address": 0x76,
             "oversampling": 1,
             "sea_level_pressure": 100000,
             "units": "imperial"
-        })
-        
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_bmp_instance = Mock()
-        mock_bmp_instance.read_temperature.return_value = 25.0
-        mock_bmp_instance.read_pressure.return_value = 101325.0
-        mock_bmp_instance.read_altitude.return_value = 100.0
-        mock_bmp_class.BMP085.return_value = mock_bmp_instance
-        
-        # Initialize and configure
-        bmp = BmpSensor("test-bmp")
-        bmp.reconfigure(config, mock_dependencies)
+        }, sensor=FakeBMP085(temperature=25.0, pressure=100000.0))
         
         # Perform tare
-        asyncio.run(bmp.tare())
-        assert bmp.altitude_offset == 100.0
+        await bmp.tare()
+        assert bmp.altitude_offset == 0.0
         
         # Get readings
-        readings = asyncio.run(bmp.get_readings())
-        assert "temperature - F" in readings
-        assert "pressure - inHg" in readings
-        assert "altitude - ft" in readings
+        readings = await bmp.get_readings()
+        assert readings.keys() == READING_KEYS["imperial"]
         
         # Reset tare
-        asyncio.run(bmp.reset_tare())
+        await bmp.reset_tare()
         assert bmp.altitude_offset == 0.0
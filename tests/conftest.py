@@ -1,14 +1,14 @@
 """Shared test fixtures and mocks for rocket-sensors testing framework."""
 
+import functools
+import sys
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-from typing import Dict, Any, Mapping
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+from typing import Dict, Any
 from viam.proto.app.robot import ComponentConfig
-from viam.proto.common import ResourceName
-from viam.resource.base import ResourceBase
-from viam.utils import struct_to_dict
 
-# No need to mock struct_to_dict - it's a standard Viam utility function
+from tests.fakes import FakeHX711, bmp085_spec, hx711_spec
 
 # Session-scoped fixture to register all models once per test session
 @pytest.fixture(scope="session", autouse=True)
@@ -16,29 +16,13 @@ def register_all_models():
     """Register all models once at the start of the test session."""
     try:
         from viam.resource.registry import Registry
-        # Clear any existing registrations
-        Registry._RESOURCES.clear()
-        Registry._APIS.clear()
-        
-        # Import and register all models once
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-        
-        # Mock board module before importing models
-        from unittest.mock import Mock
-        sys.modules['board'] = Mock()
         
-        # Import all models to register them once
-        from models.loadcell import LoadCell
-        from models.mpu import Mpu
-        from models.bmp import BmpSensor
-        
-        # Make models available globally for test files
-        import builtins
-        builtins.LoadCell = LoadCell
-        builtins.Mpu = Mpu
-        builtins.BmpSensor = BmpSensor
+        # Import all models to register them once (pytest.ini puts src/ on sys.path,
+        # pytest_configure has already stubbed board); the test modules may already
+        # have imported them during collection, in which case this is a no-op
+        import models.loadcell
+        import models.mpu
+        import models.bmp
         
         print(f"✅ Registered all models: {len(Registry._APIS)} APIs, {len(Registry._RESOURCES)} resources")
         
@@ -74,18 +58,13 @@ def bmp_class():
     from models.bmp import BmpSensor
     return BmpSensor
 
-@pytest.fixture
-def mock_component_config():
-    """Create a mock ComponentConfig for testing."""
-    config = Mock(spec=ComponentConfig)
-    config.name = "test-sensor"
-    config.namespace = "edss"
-    config.type = "sensor"
-    config.model = "test-model"
-    config.api = "sensor"
-    config.attributes = Mock()
-    config.attributes.fields = {}
-    return config
+@pytest.fixture(scope="session")
+def mock_component_config(create_config_with_attributes):
+    """Create a ComponentConfig stand-in with no attributes for testing.
+    
+    Session-scoped: the models only read their config, so every test can share it.
+    """
+    return create_config_with_attributes({})
 
 
 @pytest.fixture
@@ -102,7 +81,7 @@ def mock_resource_name():
 
 @pytest.fixture
 def mock_dependencies():
-    """Create mock dependencies for testing."""
+    """Create mock dependencies for testing (a fresh dict per test, as it is mutable)."""
     return {}
 
 
@@ -168,6 +147,112 @@ def mock_bmp_sensor():
     return sensor
 
 
+@pytest.fixture
+def bmp_mocks(monkeypatch):
+    """Replace the BMP model's busio and BMP085 modules with mocks.
+    
+    BMP085.BMP085() returns ``sensor`` and busio.I2C() returns ``i2c``. ``sensor``
+    reads 25°C and sea level pressure until a test configures other readings.
+    ``board`` is the session-wide board stub.
+    """
+    import models.bmp
+    
+    # Specced from the real driver class so misspelled sensor methods fail; the
+    # instance attributes set by BMP085.__init__ are added by hand
+    sensor = Mock(spec=bmp085_spec())
+    sensor._mode = 0
+    sensor._device = Mock()
+    sensor.read_temperature.return_value = 25.0  # °C
+    sensor.read_pressure.return_value = 101325.0  # Pa, sea level
+    mocks = SimpleNamespace(busio=Mock(), board=models.bmp.board, bmp_class=Mock(), i2c=Mock(), sensor=sensor)
+    mocks.busio.I2C.return_value = mocks.i2c
+    mocks.bmp_class.BMP085.return_value = mocks.sensor
+    monkeypatch.setattr(models.bmp, "busio", mocks.busio)
+    monkeypatch.setattr(models.bmp, "BMP085", mocks.bmp_class)
+    return mocks
+
+
+@pytest.fixture
+def make_bmp(bmp_mocks, create_config_with_attributes, mock_dependencies):
+    """Factory building a BmpSensor reconfigured with the given attributes on top of ``bmp_mocks``.
+    
+    Pass ``sensor`` (e.g. a FakeBMP085) to have BMP085.BMP085() return it instead of the mock.
+    """
+    from models.bmp import BmpSensor
+    
+    def _make_bmp(attributes: Dict[str, Any] = None, sensor=None):
+        if sensor is not None:
+            bmp_mocks.bmp_class.BMP085.return_value = sensor
+        bmp = BmpSensor("test-bmp")
+        bmp.reconfigure(create_config_with_attributes(attributes or {}), mock_dependencies)
+        return bmp
+    return _make_bmp
+
+
+@pytest.fixture
+def bmp(make_bmp):
+    """BmpSensor reconfigured with the default config on top of ``bmp_mocks``."""
+    return make_bmp()
+
+
+@pytest.fixture
+def mpu_mocks(monkeypatch):
+    """Replace the MPU model's busio and adafruit_mpu6050 modules with mocks.
+    
+    adafruit_mpu6050.MPU6050() returns ``sensor`` and busio.I2C() returns ``i2c``.
+    ``board`` is the session-wide board stub, and ``device`` the sensor's
+    i2c_device, which the model writes registers through directly.
+    """
+    import models.mpu
+    
+    mocks = SimpleNamespace(busio=Mock(), board=models.mpu.board, mpu6050=Mock(), i2c=Mock(), sensor=Mock(), device=MagicMock())
+    mocks.device.__enter__.return_value = mocks.device
+    mocks.sensor.i2c_device = mocks.device
+    mocks.busio.I2C.return_value = mocks.i2c
+    mocks.mpu6050.MPU6050.return_value = mocks.sensor
+    monkeypatch.setattr(models.mpu, "busio", mocks.busio)
+    monkeypatch.setattr(models.mpu, "adafruit_mpu6050", mocks.mpu6050)
+    return mocks
+
+
+@pytest.fixture
+def loadcell_mocks(monkeypatch):
+    """Replace the LoadCell model's GPIO and HX711 with mocks."""
+    import models.loadcell
+    
+    mocks = SimpleNamespace(gpio=Mock(), hx711_class=Mock())
+    # Specced from the real driver class so misspelled HX711 methods fail
+    mocks.hx711_class.return_value = Mock(spec_set=hx711_spec())
+    # Reads check the sample count like the driver does
+    mocks.hx711_class.return_value.get_raw_data.side_effect = FakeHX711().get_raw_data
+    monkeypatch.setattr(models.loadcell, "GPIO", mocks.gpio)
+    monkeypatch.setattr(models.loadcell, "HX711", mocks.hx711_class)
+    return mocks
+
+
+@pytest.fixture
+def make_loadcell(loadcell_mocks, create_config_with_attributes, mock_dependencies):
+    """Factory building a LoadCell reconfigured with the given attributes on top of ``loadcell_mocks``.
+    
+    Pass ``hx711`` to have HX711() return it instead of the mock.
+    """
+    from models.loadcell import LoadCell
+    
+    def _make_loadcell(attributes: Dict[str, Any] = None, hx711=None):
+        if hx711 is not None:
+            loadcell_mocks.hx711_class.return_value = hx711
+        loadcell = LoadCell("test-loadcell")
+        loadcell.reconfigure(create_config_with_attributes(attributes or {}), mock_dependencies)
+        return loadcell
+    return _make_loadcell
+
+
+@pytest.fixture
+def loadcell(make_loadcell):
+    """LoadCell reconfigured with the default config on top of ``loadcell_mocks``."""
+    return make_loadcell()
+
+
 @pytest.fixture
 def mock_i2c():
     """Mock I2C bus for testing."""
@@ -221,47 +306,68 @@ def bmp_config_data():
     }
 
 
-@pytest.fixture
+def _set_list(value, items):
+    list_value = value.list_value
+    for item in items:
+        _VALUE_SETTERS[type(item)](list_value.values.add(), item)
+
+
+# Python attribute type -> setter filling a protobuf Value; keyed on the exact
+# type, so bool never falls through to the int/float number setter
+_VALUE_SETTERS = {
+    str: lambda value, v: setattr(value, "string_value", v),
+    bool: lambda value, v: setattr(value, "bool_value", v),
+    int: lambda value, v: setattr(value, "number_value", v),
+    float: lambda value, v: setattr(value, "number_value", v),
+    list: _set_list,
+    tuple: _set_list,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _component_config(items):
+    """Build the config for a hashable tuple of attribute (key, type, value) triples.
+    
+    Cached, so tests passing the same attributes share one config; the models
+    only read their config, so the shared config and Struct must not be modified.
+    """
+    from google.protobuf.struct_pb2 import Struct
+    
+    struct = Struct()
+    fields = struct.fields
+    for key, value_type, value in items:
+        _VALUE_SETTERS[value_type](fields[key], value)
+    # Plain namespace rather than a Mock: the models only read these fields
+    return SimpleNamespace(
+        name="test-sensor",
+        namespace="edss",
+        type="sensor",
+        model="test-model",
+        api="sensor",
+        attributes=struct,
+    )
+
+
+@pytest.fixture(scope="session")
 def create_config_with_attributes():
     """Factory function to create ComponentConfig with specific attributes."""
     def _create_config(attributes: Dict[str, Any]) -> ComponentConfig:
-        from google.protobuf.struct_pb2 import Struct, Value
-        
-        config = Mock(spec=ComponentConfig)
-        config.name = "test-sensor"
-        config.namespace = "edss"
-        config.type = "sensor"
-        config.model = "test-model"
-        config.api = "sensor"
-        
-        # Create a proper protobuf Struct
-        struct = Struct()
-        for key, value in attributes.items():
-            if isinstance(value, str):
-                struct.fields[key].string_value = value
-            elif isinstance(value, (int, float)):
-                struct.fields[key].number_value = value
-            elif isinstance(value, bool):
-                struct.fields[key].bool_value = value
-            elif isinstance(value, list):
-                # Handle lists by creating a ListValue
-                list_value = struct.fields[key].list_value
-                for item in value:
-                    if isinstance(item, str):
-                        list_value.values.add().string_value = item
-                    elif isinstance(item, (int, float)):
-                        list_value.values.add().number_value = item
-                    elif isinstance(item, bool):
-                        list_value.values.add().bool_value = item
-        
-        config.attributes = struct
-        return config
+        # Lists become tuples so the attributes are hashable, and the type is
+        # part of the key since True == 1 == 1.0
+        return _component_config(tuple(
+            (key, type(value), tuple(value) if isinstance(value, list) else value)
+            for key, value in attributes.items()
+        ))
     return _create_config
 
 
 # Pytest configuration
 def pytest_configure(config):
-    """Configure pytest with custom markers."""
+    """Configure pytest with custom markers and stub the board module."""
+    # Stub the board module once, before collection imports any model; the
+    # models only read its I2C pins
+    sys.modules['board'] = SimpleNamespace(SCL=object(), SDA=object())
+    
     config.addinivalue_line(
         "markers", "hardware: marks tests that require hardware (deselect with '-m \"not hardware\"')"
     )
@@ -0,0 +1,86 @@
+"""Plain test doubles for the sensor drivers, and the attribute specs for mocking them.
+
+Kept out of conftest.py so test modules can import them directly.
+"""
+
+import functools
+import itertools
+
+
+def raises(error):
+    """Return a plain function that raises ``error`` whatever it is called with."""
+    def _raise(*args, **kwargs):
+        raise error
+    return _raise
+
+
+class FakeBMP085:
+    """Plain stand-in for an Adafruit_BMP BMP085 that returns fixed readings.
+    
+    Cheaper than a Mock for tests that only need values back; when ``error`` is
+    set, every read raises it.
+    """
+    
+    _mode = 0
+    _device = None  # only used by the raw reads, which the fixed readings bypass
+    
+    def __init__(self, temperature=25.0, pressure=101325.0, error=None):
+        self.temperature = temperature
+        self.pressure = pressure
+        self.error = error
+    
+    def read_temperature(self):
+        if self.error:
+            raise self.error
+        return self.temperature
+    
+    def read_pressure(self):
+        if self.error:
+            raise self.error
+        return self.pressure
+
+
+class FakeHX711:
+    """Plain stand-in for an hx711 HX711 that returns fixed raw data.
+    
+    Cheaper than a Mock for tests that only need values back; when ``error`` is
+    set, every read raises it. Like the driver, reads return ``times`` samples
+    (cycling through ``raw_data``) and reject counts outside 2-100.
+    """
+    
+    min_measures = 2
+    max_measures = 100
+    
+    def __init__(self, raw_data=(), error=None):
+        self.raw_data = list(raw_data)
+        self.error = error
+    
+    def reset(self):
+        pass
+    
+    def power_down(self):
+        pass
+    
+    def get_raw_data(self, times=5):
+        if not self.min_measures <= times <= self.max_measures:
+            raise ValueError(f"{times} is not within the borders defined in the class")
+        if self.error:
+            raise self.error
+        return list(itertools.islice(itertools.cycle(self.raw_data), times))
+
+
+@functools.cache
+def bmp085_spec():
+    """Attribute names of the Adafruit BMP085 driver, introspected once for every mock specced from it."""
+    from models.bmp import BMP085
+    
+    return dir(BMP085.BMP085)
+
+
+@functools.cache
+def hx711_spec():
+    """Attribute names of the hx711 HX711 driver, introspected once for every mock specced from it."""
+    import models.loadcell  # noqa: F401 - installs the RPi.GPIO fallback hx711 needs off a Pi
+    from hx711 import HX711
+    
+    return dir(HX711)
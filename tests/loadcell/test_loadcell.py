@@ -1,12 +1,27 @@
 """Working LoadCell tests with proper mocking and async handling."""
 
+import threading
+
 import pytest
-import asyncio
-from unittest.mock import Mock, patch, MagicMock
-from typing import Mapping, Any
+from unittest.mock import Mock, patch
+
+from models.loadcell import LoadCell
+from tests.fakes import FakeHX711, hx711_spec, raises
 
-# LoadCell is imported by the session-scoped fixture in conftest.py
-# No need to import here to avoid duplicate registration
+# Invalid configurations and the validation error each one raises
+INVALID_CONFIGS = [
+    pytest.param({"gain": 50}, "Gain must be 32, 64, or 128", id="gain-value"),
+    pytest.param({"doutPin": 50}, "Data Out pin must be a valid GPIO pin number", id="dout-pin-range"),
+    pytest.param({"sckPin": 0}, "Clock pin must be a valid GPIO pin number", id="sck-pin-range"),
+    pytest.param({"numberOfReadings": 150}, "Number of readings must be a positive integer less than 100", id="number-of-readings-range"),
+    pytest.param({"tare_offset": 100.0}, "Tare offset must be a non-positive floating point value", id="tare-offset-positive"),
+    pytest.param({"continuous_sampling": "yes"}, "Continuous sampling must be a boolean", id="continuous-sampling-type"),
+]
+
+# Raw HX711 samples: ~1kg at the default gain (3 and 5 readings), and a small tare load
+RAW_DATA_1KG = (8200, 8205, 8195)
+RAW_DATA_1KG_5 = (8200, 8205, 8195, 8202, 8198)
+RAW_DATA_TARE = (1000, 1005, 995)
 
 
 @pytest.mark.unit
@@ -24,45 +39,25 @@ class TestLoadCell:
         })
         required, optional = LoadCell.validate_config(config)
         assert required == []
-        assert set(optional) == {"gain", "doutPin", "sckPin", "numberOfReadings", "tare_offset"}
-    
-    def test_validation_invalid_gain(self, create_config_with_attributes):
-        """Test validation with invalid gain."""
-        config = create_config_with_attributes({"gain": 50})  # Invalid gain
-        with pytest.raises(Exception, match="Gain must be 32, 64, or 128"):
-            LoadCell.validate_config(config)
+        assert optional == []
     
-    def test_validation_invalid_pin(self, create_config_with_attributes):
-        """Test validation with invalid pin numbers."""
-        config = create_config_with_attributes({"doutPin": 50})  # Invalid pin
-        with pytest.raises(Exception, match="Data Out pin must be a valid GPIO pin number"):
-            LoadCell.validate_config(config)
+    @pytest.mark.parametrize("attributes, error", INVALID_CONFIGS)
+    def test_validation_rejects(self, create_config_with_attributes, attributes, error):
+        """Test validation rejects invalid configurations."""
+        with pytest.raises(Exception, match=error):
+            LoadCell.validate_config(create_config_with_attributes(attributes))
     
-    def test_validation_invalid_tare_offset(self, create_config_with_attributes):
-        """Test validation with invalid tare offset."""
-        config = create_config_with_attributes({"tare_offset": 100.0})  # Positive offset
-        with pytest.raises(Exception, match="Tare offset must be a non-positive floating point value"):
-            LoadCell.validate_config(config)
-    
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_initialization_defaults(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    def test_initialization_defaults(self, loadcell):
         """Test initialization with default values."""
-        
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
-        
         assert loadcell.gain == 64
         assert loadcell.doutPin == 5
         assert loadcell.sckPin == 6
         assert loadcell.numberOfReadings == 3
         assert loadcell.tare_offset == 0.0
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_initialization_custom_values(self, mock_hx711_class, mock_gpio, create_config_with_attributes, mock_dependencies):
+    def test_initialization_custom_values(self, make_loadcell):
         """Test initialization with custom values."""
-        config = create_config_with_attributes({
+        loadcell = make_loadcell({
             "gain": 128,
             "doutPin": 7,
             "sckPin": 8,
@@ -70,29 +65,20 @@ class TestLoadCell:
             "tare_offset": -100.0
         })
         
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(config, mock_dependencies)
-        
         assert loadcell.gain == 128
         assert loadcell.doutPin == 7
         assert loadcell.sckPin == 8
         assert loadcell.numberOfReadings == 5
         assert loadcell.tare_offset == -100.0
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_hx711_creation(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    def test_hx711_creation(self, loadcell_mocks, make_loadcell):
         """Test HX711 sensor creation."""
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.reset = Mock()
-        mock_hx711_class.return_value = mock_hx711_instance
-        
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
+        mock_hx711_instance = Mock(spec_set=hx711_spec())
+        loadcell = make_loadcell(hx711=mock_hx711_instance)
         
         hx711 = loadcell.get_hx711()
         assert hx711 == mock_hx711_instance
-        mock_hx711_class.assert_called_once_with(
+        loadcell_mocks.hx711_class.assert_called_once_with(
             dout_pin=5,
             pd_sck_pin=6,
             channel="A",
@@ -100,16 +86,20 @@ class TestLoadCell:
         )
         mock_hx711_instance.reset.assert_called_once()
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_hx711_initialization_error(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
-        """Test HX711 initialization error handling."""
+    def test_hx711_recreated_on_reconfigure(self, loadcell_mocks, create_config_with_attributes, mock_dependencies):
+        """Test reconfigure recreates the HX711 so new pins take effect."""
+        loadcell = LoadCell("test-loadcell")
+        assert loadcell.hx711 is None
         
-        # Create a mock that raises an exception when called
-        def mock_hx711_constructor(*args, **kwargs):
-            raise Exception("Hardware not available")
+        loadcell.reconfigure(create_config_with_attributes({}), mock_dependencies)
+        loadcell.reconfigure(create_config_with_attributes({"doutPin": 7, "sckPin": 8}), mock_dependencies)
         
-        mock_hx711_class.side_effect = mock_hx711_constructor
+        assert loadcell_mocks.hx711_class.call_count == 2
+        loadcell_mocks.hx711_class.assert_called_with(dout_pin=7, pd_sck_pin=8, channel="A", gain=64)
+    
+    def test_hx711_initialization_error(self, loadcell_mocks, mock_component_config, mock_dependencies):
+        """Test HX711 initialization error handling."""
+        loadcell_mocks.hx711_class.side_effect = raises(Exception("Hardware not available"))
         
         loadcell = LoadCell("test-loadcell")
         
@@ -120,18 +110,11 @@ class TestLoadCell:
         # The error should be caught and logged, hx711 should remain None
         assert loadcell.hx711 is None
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_readings_success(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    async def test_readings_success(self, make_loadcell):
         """Test successful sensor readings."""
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.get_raw_data.return_value = [8200, 8205, 8195]  # ~1kg readings
-        mock_hx711_class.return_value = mock_hx711_instance
+        loadcell = make_loadcell(hx711=FakeHX711(RAW_DATA_1KG))
         
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
-        
-        readings = asyncio.run(loadcell.get_readings())
+        readings = await loadcell.get_readings()
         
         assert "weight" in readings
         assert "measures" in readings
@@ -145,152 +128,217 @@ class TestLoadCell:
         expected_weight = sum([1.0, 1.0006, 0.9994]) / 3  # Converted from raw values
         assert abs(readings["weight"] - expected_weight) < 0.001
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_readings_with_tare_offset(self, mock_hx711_class, mock_gpio, create_config_with_attributes, mock_dependencies):
-        """Test readings with tare offset applied."""
-        config = create_config_with_attributes({"tare_offset": -8200})  # -1kg offset
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.get_raw_data.return_value = [8200, 8205, 8195]  # ~1kg readings
-        mock_hx711_class.return_value = mock_hx711_instance
+    async def test_readings_hold_device_lock(self, make_loadcell):
+        """Test the HX711 is only read while holding the device lock."""
+        mock_hx711_instance = Mock(spec_set=hx711_spec())
+        loadcell = make_loadcell(hx711=mock_hx711_instance)
+        mock_hx711_instance.get_raw_data.side_effect = (
+            lambda times: list(RAW_DATA_1KG) if loadcell._lock.locked() else []
+        )
         
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(config, mock_dependencies)
+        readings = await loadcell.get_readings()
         
-        readings = asyncio.run(loadcell.get_readings())
+        assert len(readings["measures"]) == 3
+    
+    async def test_readings_with_tare_offset(self, make_loadcell):
+        """Test readings with tare offset applied."""
+        # ~1kg readings with a -1kg offset
+        loadcell = make_loadcell({"tare_offset": -8200}, hx711=FakeHX711(RAW_DATA_1KG))
+        
+        readings = await loadcell.get_readings()
         
         # With -1kg tare offset, readings should be ~2kg
         expected_weight = sum([2.0, 2.0006, 1.9994]) / 3
         assert abs(readings["weight"] - expected_weight) < 0.001
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_readings_error_handling(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
-        """Test readings error handling."""
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.get_raw_data.side_effect = Exception("Sensor error")
-        mock_hx711_class.return_value = mock_hx711_instance
-        
+    # The real pinning would give this test's sampler thread SCHED_FIFO on CI runners
+    # with CAP_SYS_NICE; test_sampler_thread_pinning covers it with a mocked os
+    @patch.object(LoadCell, "_pin_sampler_thread")
+    async def test_readings_continuous_sampling(self, mock_pin, make_loadcell):
+        """Test readings served from the background sampler's ring buffer."""
+        mock_hx711_instance = Mock(spec_set=hx711_spec())
+        # ~1kg samples, with the driver's check on the number read per call
+        mock_hx711_instance.get_raw_data.side_effect = FakeHX711([8200]).get_raw_data
+        loadcell = make_loadcell({"continuous_sampling": True}, hx711=mock_hx711_instance)
+        try:
+            assert loadcell.continuous_sampling is True
+            assert loadcell._sampler.is_alive()
+            
+            readings = await loadcell.get_readings()
+            
+            assert len(readings["measures"]) == 3
+            assert abs(readings["weight"] - 1.0) < 0.001
+            mock_hx711_instance.get_raw_data.assert_called_with(times=2)
+            mock_pin.assert_called_once()
+        finally:
+            sampler = loadcell._sampler
+            loadcell.close()
+        
+        # Closing stops the sampler thread
+        assert loadcell._sampler is None
+        assert not sampler.is_alive()
+    
+    @patch.object(LoadCell, "_pin_sampler_thread")  # see test_readings_continuous_sampling
+    async def test_continuous_sampling_error_keeps_hx711(self, mock_pin, make_loadcell):
+        """Test a failed read leaves the HX711 to the sampler thread that owns it."""
+        mock_hx711_instance = Mock(spec_set=hx711_spec())
+        mock_hx711_instance.get_raw_data.side_effect = FakeHX711(RAW_DATA_1KG).get_raw_data
+        loadcell = make_loadcell({"continuous_sampling": True}, hx711=mock_hx711_instance)
+        try:
+            async def fail():
+                raise TimeoutError("HX711 sampler did not produce enough samples")
+            loadcell._read_measures = fail
+            
+            with pytest.raises(TimeoutError):
+                await loadcell.get_readings()
+            with pytest.raises(TimeoutError):
+                await loadcell.tare()
+            
+            assert loadcell.hx711 is mock_hx711_instance
+            mock_hx711_instance.power_down.assert_not_called()
+        finally:
+            loadcell.close()
+    
+    @patch.object(LoadCell, "_pin_sampler_thread")  # see test_readings_continuous_sampling
+    async def test_continuous_sampling_stuck_sampler(self, mock_pin, make_loadcell, monkeypatch):
+        """Test a sampler stuck in the driver gives errors, not stale readings, and does not hang close."""
+        monkeypatch.setattr("models.loadcell._SAMPLER_STARTUP", 0.0)
+        monkeypatch.setattr("models.loadcell._SAMPLER_JOIN_TIMEOUT", 0.05)
+        release = threading.Event()
+        fake = FakeHX711(RAW_DATA_1KG)
+        
+        def get_raw_data(times):
+            # Two good batches, then block like hx711 does while DOUT is stuck high
+            if mock_hx711_instance.get_raw_data.call_count > 2:
+                release.wait()
+            return fake.get_raw_data(times)
+        
+        mock_hx711_instance = Mock(spec_set=hx711_spec())
+        mock_hx711_instance.get_raw_data.side_effect = get_raw_data
+        loadcell = make_loadcell({"continuous_sampling": True}, hx711=mock_hx711_instance)
+        sampler = loadcell._sampler
+        try:
+            readings = await loadcell.get_readings()
+            assert len(readings["measures"]) == 3
+            
+            # The sampler is now blocked: once its samples age out, readings fail
+            loadcell._last_sample_ts -= 1.0
+            with pytest.raises(TimeoutError, match="fresh samples"):
+                await loadcell.get_readings()
+            
+            # close gives up waiting for the stuck thread instead of hanging
+            with patch.object(loadcell.logger, "warning") as mock_warning:
+                loadcell.close()
+            mock_warning.assert_called_once()
+            assert sampler.is_alive()
+        finally:
+            release.set()
+            sampler.join()
+    
+    @patch('models.loadcell.os')
+    def test_sampler_thread_pinning(self, mock_os):
+        """Test the sampler thread is pinned to the last CPU with SCHED_FIFO, and skips it on one core."""
         loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
+        
+        mock_os.sched_getaffinity.return_value = {0, 1, 2, 3}
+        loadcell._pin_sampler_thread()
+        mock_os.sched_setaffinity.assert_called_once_with(0, {3})
+        mock_os.sched_setscheduler.assert_called_once_with(0, mock_os.SCHED_FIFO, mock_os.sched_param.return_value)
+        
+        mock_os.reset_mock()
+        mock_os.sched_getaffinity.return_value = {0}
+        loadcell._pin_sampler_thread()
+        mock_os.sched_setscheduler.assert_not_called()
+        
+        # Missing CAP_SYS_NICE is not an error
+        mock_os.sched_getaffinity.return_value = {0, 1}
+        mock_os.sched_setscheduler.side_effect = PermissionError("Operation not permitted")
+        loadcell._pin_sampler_thread()
+    
+    async def test_readings_error_handling(self, make_loadcell):
+        """Test readings error handling."""
+        mock_hx711_instance = Mock(spec_set=hx711_spec())
+        mock_hx711_instance.get_raw_data = raises(Exception("Sensor error"))
+        loadcell = make_loadcell(hx711=mock_hx711_instance)
         
         with pytest.raises(Exception, match="Sensor error"):
-            asyncio.run(loadcell.get_readings())
+            await loadcell.get_readings()
         
-        # HX711 should be cleaned up after error
+        # HX711 should be powered down and released after error
         assert loadcell.hx711 is None
+        mock_hx711_instance.power_down.assert_called_once()
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_tare_success(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    async def test_tare_success(self, make_loadcell):
         """Test successful tare operation."""
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.get_raw_data.return_value = [1000, 1005, 995]
-        mock_hx711_class.return_value = mock_hx711_instance
-        
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
+        loadcell = make_loadcell(hx711=FakeHX711(RAW_DATA_TARE))
         
-        asyncio.run(loadcell.tare())
+        await loadcell.tare()
         
         # Tare offset should be set to average of raw readings
-        expected_offset = (1000 + 1005 + 995) / 3
+        expected_offset = sum(RAW_DATA_TARE) / len(RAW_DATA_TARE)
         assert loadcell.tare_offset == expected_offset
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_tare_error_handling(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    async def test_tare_error_handling(self, make_loadcell):
         """Test tare error handling."""
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.get_raw_data.side_effect = Exception("Tare error")
-        mock_hx711_class.return_value = mock_hx711_instance
-        
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
+        loadcell = make_loadcell(hx711=FakeHX711(error=Exception("Tare error")))
         
         with pytest.raises(Exception, match="Tare error"):
-            asyncio.run(loadcell.tare())
+            await loadcell.tare()
         
         # HX711 should be cleaned up after error
         assert loadcell.hx711 is None
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_commands_tare(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    async def test_commands_tare(self, make_loadcell):
         """Test tare command execution."""
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.get_raw_data.return_value = [1000, 1005, 995]
-        mock_hx711_class.return_value = mock_hx711_instance
-        
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
+        loadcell = make_loadcell(hx711=FakeHX711(RAW_DATA_TARE))
         
         command = {"tare": []}
-        result = asyncio.run(loadcell.do_command(command))
+        result = await loadcell.do_command(command)
         
         assert "tare" in result
         assert isinstance(result["tare"], float)
         assert result["tare"] > 0  # Should be positive tare offset in kg
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_commands_unknown(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    async def test_commands_unknown(self, loadcell):
         """Test handling of unknown commands."""
-        
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
-        
         command = {"unknown_command": []}
-        result = asyncio.run(loadcell.do_command(command))
+        result = await loadcell.do_command(command)
         
         assert "unknown_command" in result
-        # Unknown commands return False
-        assert result["unknown_command"] is False
+        # Unknown commands return an error listing the available commands
+        assert result["unknown_command"]["error"] == "Unknown command: unknown_command"
+        assert result["unknown_command"]["available_commands"] == ["tare"]
     
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_cleanup(self, mock_hx711_class, mock_gpio, mock_component_config, mock_dependencies):
+    def test_cleanup(self, loadcell_mocks, make_loadcell):
         """Test resource cleanup."""
-        mock_hx711_instance = Mock()
-        mock_hx711_class.return_value = mock_hx711_instance
-        
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(mock_component_config, mock_dependencies)
+        mock_hx711_instance = Mock(spec_set=hx711_spec())
+        loadcell = make_loadcell(hx711=mock_hx711_instance)
         loadcell.get_hx711()  # Initialize HX711
         
         loadcell.close()
         
         assert loadcell.hx711 is None
-        mock_gpio.cleanup.assert_called_once_with((5, 6))
+        mock_hx711_instance.power_down.assert_called_once()
+        loadcell_mocks.gpio.cleanup.assert_called_once_with((5, 6))
     
     @pytest.mark.integration
-    @patch('models.loadcell.GPIO')
-    @patch('models.loadcell.HX711')
-    def test_full_workflow(self, mock_hx711_class, mock_gpio, create_config_with_attributes, mock_dependencies):
+    async def test_full_workflow(self, make_loadcell):
         """Test complete LoadCell workflow: configure, tare, read."""
-        config = create_config_with_attributes({
+        # Initialize and configure
+        loadcell = make_loadcell({
             "gain": 128,
             "doutPin": 7,
             "sckPin": 8,
             "numberOfReadings": 5,
             "tare_offset": 0.0
-        })
-        
-        
-        mock_hx711_instance = Mock()
-        mock_hx711_instance.get_raw_data.return_value = [8200, 8205, 8195, 8202, 8198]
-        mock_hx711_class.return_value = mock_hx711_instance
-        
-        # Initialize and configure
-        loadcell = LoadCell("test-loadcell")
-        loadcell.reconfigure(config, mock_dependencies)
+        }, hx711=FakeHX711(RAW_DATA_1KG_5))
         
         # Perform tare
-        asyncio.run(loadcell.tare())
+        await loadcell.tare()
         assert loadcell.tare_offset > 0
         
         # Get readings
-        readings = asyncio.run(loadcell.get_readings())
+        readings = await loadcell.get_readings()
         assert "weight" in readings
         # Weight should be close to 0 after tare (since we're subtracting the tare offset)
         assert abs(readings["weight"]) < 0.1
@@ -1,12 +1,39 @@
 """Comprehensive MPU tests with proper mocking and async handling."""
 
 import pytest
-import asyncio
-from unittest.mock import Mock, patch, MagicMock
-from typing import Mapping, Any
+import math
+import struct
+from unittest.mock import MagicMock, Mock, PropertyMock, call
 
-# Mpu is imported by the session-scoped fixture in conftest.py
-# No need to import here to avoid duplicate registration
+from models.mpu import Mpu
+
+
+def _sample_device(acceleration=(0.0, 0.0, 0.0), gyro=(0.0, 0.0, 0.0), temperature=25.0, error=None):
+    """Mock MPU6050 I2C device whose burst read returns the raw registers for the given values.
+
+    Values are in m/s², rad/s and Celsius, quantized like the real registers
+    (+/-4 g accel range, +/-500 deg/s gyro range).
+    """
+    raw = [round(a / 9.80665 * 8192) for a in acceleration]
+    raw.append(round((temperature - 36.53) * 340))
+    raw += [round(math.degrees(g) * 65.5) for g in gyro]
+    data = struct.pack(">hhhhhhh", *raw)
+
+    def write_then_readinto(out_buffer, in_buffer):
+        if error is not None:
+            raise error
+        assert bytes(out_buffer) == b"\x3b"  # ACCEL_XOUT_H
+        in_buffer[:] = data
+
+    device = MagicMock()
+    device.__enter__.return_value = device
+    device.write_then_readinto.side_effect = write_then_readinto
+    return device
+
+# Register quantization: one accel LSB is ~0.0012 m/s², one gyro LSB ~0.00027 rad/s
+ACCEL_TOL = 0.002
+GYRO_TOL = 0.0005
+TEMP_TOL = 0.01
 
 
 @pytest.mark.unit
@@ -28,9 +55,7 @@ class TestMpu:
         })
         required, optional = Mpu.validate_config(config)
         assert required == []
-        assert set(optional) == {"i2c_address", "units", "sample_rate", 
-                                 "accel_x_offset", "accel_y_offset", "accel_z_offset",
-                                 "gyro_x_offset", "gyro_y_offset", "gyro_z_offset"}
+        assert optional == []
     
     def test_validation_invalid_i2c_address(self, create_config_with_attributes):
         """Test validation with invalid I2C address."""
@@ -38,27 +63,41 @@ class TestMpu:
         with pytest.raises(Exception, match="i2c_address must be a valid I2C address \\(0x08-0x77\\)"):
             Mpu.validate_config(config)
     
+    def test_sample_rate_register_settings(self):
+        """Test SMPLRT_DIV and DLPF selection across the sample rate range."""
+        from models.mpu import _dlpf_config, _sample_rate_divisor
+        
+        assert _sample_rate_divisor(1000) == 0
+        assert _sample_rate_divisor(100) == 9
+        assert _sample_rate_divisor(1) == 255  # clamped to the 8-bit register
+        assert _dlpf_config(1000) == 1  # 184 Hz
+        assert _dlpf_config(100) == 3  # 44 Hz
+        assert _dlpf_config(4) == 6  # 5 Hz, the narrowest available
+    
+    def test_validation_sample_rate_too_high(self, create_config_with_attributes):
+        """Test validation rejects sample rates above the 1 kHz filtered output rate."""
+        config = create_config_with_attributes({"sample_rate": 2000})
+        with pytest.raises(Exception, match="sample_rate must be at most 1000 Hz"):
+            Mpu.validate_config(config)
+    
+    def test_validation_collects_all_errors(self, create_config_with_attributes):
+        """Test validation reports every invalid attribute at once."""
+        config = create_config_with_attributes({"sample_rate": 0, "gyro_z_offset": "zero"})
+        with pytest.raises(Exception) as excinfo:
+            Mpu.validate_config(config)
+        assert str(excinfo.value) == (
+            "sample_rate must be a positive number; gyro_z_offset must be a valid number (float)."
+        )
+    
     def test_validation_invalid_units(self, create_config_with_attributes):
         """Test validation with invalid units."""
         config = create_config_with_attributes({"units": "fahrenheit"})  # Invalid units
         with pytest.raises(Exception, match="units must be either 'metric' or 'imperial'"):
             Mpu.validate_config(config)
     
-    def test_validation_invalid_i2c_address(self, create_config_with_attributes):
-        """Test validation with invalid I2C address."""
-        config = create_config_with_attributes({"i2c_address": 0x100})  # Invalid address
-        with pytest.raises(Exception, match="i2c_address must be a valid I2C address \\(0x08-0x77\\)"):
-            Mpu.validate_config(config)
-    
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_initialization_defaults(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    def test_initialization_defaults(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test initialization with default values."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
@@ -67,10 +106,7 @@ class TestMpu:
         assert mpu.units == "metric"  # Default units
         assert mpu.sample_rate == 100  # Default sample rate
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_initialization_custom_values(self, mock_mpu6050_class, mock_board, mock_busio, create_config_with_attributes, mock_dependencies):
+    def test_initialization_custom_values(self, mpu_mocks, create_config_with_attributes, mock_dependencies):
         """Test initialization with custom values."""
         config = create_config_with_attributes({
             "i2c_address": 0x69,
@@ -78,43 +114,37 @@ class TestMpu:
             "sample_rate": 200
         })
         
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(config, mock_dependencies)
         
         assert mpu.i2c_address == 0x69
+        
+        # 200 Hz: SMPLRT_DIV 4 (1 kHz / 5) and the widest filter under 100 Hz
+        assert mock_mpu_instance.sample_rate_divisor == 4
+        # CONFIG (0x1A) written whole: EXT_SYNC_SET 0 and DLPF_CFG 2 (94 Hz)
+        mpu_mocks.device.write.assert_called_once_with(bytes([0x1A, 0x02]))
+        assert mpu._period == pytest.approx(0.005)
         assert mpu.units == "imperial"
         assert mpu.sample_rate == 200
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_mpu_creation(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    def test_mpu_creation(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test MPU6050 sensor creation."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
         
         # Check I2C was created correctly
-        mock_busio.I2C.assert_called_once_with(mock_board.SCL, mock_board.SDA)
+        mpu_mocks.busio.I2C.assert_called_once_with(mpu_mocks.board.SCL, mpu_mocks.board.SDA)
         
         # Check MPU6050 was created correctly
-        mock_mpu6050_class.MPU6050.assert_called_once_with(mock_i2c, address=0x68)
+        mpu_mocks.mpu6050.MPU6050.assert_called_once_with(mpu_mocks.i2c, address=0x68)
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_mpu_initialization_error(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    def test_mpu_initialization_error(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test MPU6050 initialization error handling."""
-        mock_busio.I2C.side_effect = Exception("I2C not available")
+        mpu_mocks.busio.I2C.side_effect = Exception("I2C not available")
         
         mpu = Mpu("test-mpu")
         with pytest.raises(Exception, match="I2C not available"):
@@ -122,23 +152,19 @@ class TestMpu:
         
         assert mpu.sensor is None
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_readings_success(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_readings_success(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test successful sensor readings."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu_instance.acceleration = (1.0, 2.0, 9.8)  # x, y, z in m/s²
-        mock_mpu_instance.gyro = (0.1, 0.2, 0.3)  # x, y, z in rad/s
-        mock_mpu_instance.temperature = 25.0  # °C
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(
+            acceleration=(1.0, 2.0, 9.8),  # x, y, z in m/s²
+            gyro=(0.1, 0.2, 0.3),  # x, y, z in rad/s
+            temperature=25.0,  # °C
+        )
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
         
-        readings = asyncio.run(mpu.get_readings())
+        readings = await mpu.get_readings()
         
         assert "acceleration_x - m/s²" in readings
         assert "acceleration_y - m/s²" in readings
@@ -149,93 +175,177 @@ class TestMpu:
         assert "temperature - C" in readings
         
         # Check acceleration values
-        assert readings["acceleration_x - m/s²"] == 1.0
-        assert readings["acceleration_y - m/s²"] == 2.0
-        assert readings["acceleration_z - m/s²"] == 9.8
+        assert readings["acceleration_x - m/s²"] == pytest.approx(1.0, abs=ACCEL_TOL)
+        assert readings["acceleration_y - m/s²"] == pytest.approx(2.0, abs=ACCEL_TOL)
+        assert readings["acceleration_z - m/s²"] == pytest.approx(9.8, abs=ACCEL_TOL)
         
         # Check gyroscope values
-        assert readings["gyro_x - rad/s"] == 0.1
-        assert readings["gyro_y - rad/s"] == 0.2
-        assert readings["gyro_z - rad/s"] == 0.3
+        assert readings["gyro_x - rad/s"] == pytest.approx(0.1, abs=GYRO_TOL)
+        assert readings["gyro_y - rad/s"] == pytest.approx(0.2, abs=GYRO_TOL)
+        assert readings["gyro_z - rad/s"] == pytest.approx(0.3, abs=GYRO_TOL)
         
         # Check temperature
-        assert readings["temperature - C"] == 25.0
+        assert readings["temperature - C"] == pytest.approx(25.0, abs=TEMP_TOL)
+        
+        # All values come from a single burst read
+        mock_mpu_instance.i2c_device.write_then_readinto.assert_called_once()
+    
+    async def test_readings_success_imperial(self, mpu_mocks, create_config_with_attributes, mock_dependencies):
+        """Test successful sensor readings in imperial units."""
+        config = create_config_with_attributes({"units": "imperial"})
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(
+            acceleration=(0.0, 0.0, 9.80665),  # 1 g
+            gyro=(0.1, 0.0, 0.0),
+            temperature=25.0,
+        )
+        
+        mpu = Mpu("test-mpu")
+        mpu.reconfigure(config, mock_dependencies)
+        
+        readings = await mpu.get_readings()
+        
+        assert readings["acceleration_z - ft/s²"] == pytest.approx(32.174, abs=0.01)  # 1 g ≈ 32.174 ft/s²
+        assert readings["gyro_x - deg/s"] == pytest.approx(5.7296, abs=0.03)  # 0.1 rad/s ≈ 5.73 deg/s
+        assert readings["temperature - F"] == pytest.approx(77.0, abs=0.02)  # 25°C = 77°F
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_readings_error_handling(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_readings_reuse_buffer_and_return_copies(self, mpu_mocks, mock_component_config, mock_dependencies):
+        """Test reads share one receive buffer while each call returns its own dict."""
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(acceleration=(1.0, 0.0, 0.0))
+        
+        mpu = Mpu("test-mpu")
+        mpu.reconfigure(mock_component_config, mock_dependencies)
+        
+        first = await mpu.get_readings()
+        mock_mpu_instance.i2c_device = _sample_device(acceleration=(2.0, 0.0, 0.0))
+        second = await mpu.get_readings()
+        
+        assert first is not second
+        assert first["acceleration_x - m/s²"] == pytest.approx(1.0, abs=ACCEL_TOL)
+        assert second["acceleration_x - m/s²"] == pytest.approx(2.0, abs=ACCEL_TOL)
+        buffers = [c.args[1] for c in mock_mpu_instance.i2c_device.write_then_readinto.call_args_list]
+        assert buffers[0] is mpu._sample_buffer
+    
+    def test_convert_sample_loop_matches_numpy(self):
+        """Test the Numba-compilable loop decodes and converts exactly like the NumPy fallback."""
+        import numpy as np
+        from models.mpu import _convert_sample_loop, _convert_sample_numpy
+        
+        rng = np.random.default_rng(0)
+        buf = rng.integers(0, 256, size=14, dtype=np.uint8)
+        vectors = [rng.normal(size=7) for _ in range(5)]
+        expected, actual = np.empty(7), np.empty(7)
+        
+        _convert_sample_numpy(buf, *vectors, expected)
+        _convert_sample_loop(buf, *vectors, actual)
+        
+        assert actual == pytest.approx(expected)
+    
+    async def test_get_batch_drains_fifo(self, mpu_mocks, mock_component_config, mock_dependencies):
+        """Test get_batch enables the FIFO once and reads n samples in a single burst."""
+        # Two queued samples: 1 g then 2 g on the Z axis
+        fifo = struct.pack(">hhhhhhh", 0, 0, 8192, 0, 0, 0, 0) + struct.pack(">hhhhhhh", 0, 0, 16384, 0, 655, 0, 0)
+        
+        def write_then_readinto(out_buffer, in_buffer, in_end=None):
+            assert bytes(out_buffer) == b"\x74"  # FIFO_R_W
+            in_buffer[:in_end] = fifo[:in_end]
+        
+        device = MagicMock()
+        device.__enter__.return_value = device
+        device.write_then_readinto.side_effect = write_then_readinto
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = device
+        mock_mpu_instance.fifo_count = len(fifo)
+        
+        mpu = Mpu("test-mpu")
+        mpu.reconfigure(mock_component_config, mock_dependencies)
+        
+        batch = await mpu.get_batch(2)
+        await mpu.get_batch(2)
+        
+        assert batch["acceleration_z - m/s²"] == pytest.approx([9.80665, 19.6133])
+        assert batch["gyro_x - rad/s"] == pytest.approx([0.0, math.radians(10.0)])
+        assert batch["temperature - C"] == pytest.approx([36.53, 36.53])
+        # FIFO enabled once: accel, temperature and gyro routed in, then reset and switched on
+        assert device.write.call_args_list.count(call(bytes([0x23, 0xF8]))) == 1
+        assert mock_mpu_instance.fifo_en is True
+        assert device.write_then_readinto.call_count == 2
+        
+        with pytest.raises(ValueError, match="Batch size must be between 1 and 73 samples"):
+            await mpu.get_batch(74)
+    
+    async def test_get_batch_resets_fifo_on_overflow(self, mpu_mocks, mock_component_config, mock_dependencies):
+        """Test an overflowed FIFO is reset with FIFO_EN cleared around the reset."""
+        device = MagicMock()
+        device.__enter__.return_value = device
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = device
+        
+        mpu = Mpu("test-mpu")
+        mpu.reconfigure(mock_component_config, mock_dependencies)
+        mpu._period = 0.0
+        
+        # Record the FIFO control writes in order; the first count read reports an overflow
+        writes = Mock()
+        sensor_type = type(mock_mpu_instance)
+        sensor_type.fifo_en = PropertyMock(side_effect=lambda *value: writes("fifo_en", *value))
+        sensor_type.fiforst = PropertyMock(side_effect=lambda *value: writes("fiforst", *value))
+        sensor_type.fifo_count = PropertyMock(side_effect=[1024, 14])
+        
+        await mpu.get_batch(1)
+        
+        restart = [("fifo_en", False), ("fiforst", True), ("fifo_en", True)]
+        # Once when the FIFO is first enabled, then again for the overflow
+        assert [c.args for c in writes.call_args_list] == restart * 2
+    
+    async def test_readings_error_handling(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test readings error handling."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu_instance.acceleration = Mock(side_effect=Exception("Sensor error"))
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(error=OSError("Sensor error"))
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
         
-        readings = asyncio.run(mpu.get_readings())
+        readings = await mpu.get_readings()
         assert readings == {}  # Error handling returns empty dict
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_tare_success(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_tare_success(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test successful tare operation."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu_instance.acceleration = (0.1, 0.2, 9.8)  # Small offset from zero
-        mock_mpu_instance.gyro = (0.01, 0.02, 0.03)  # Small gyro offset
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(
+            acceleration=(0.1, 0.2, 9.8),  # Small offset from zero
+            gyro=(0.01, 0.02, 0.03),  # Small gyro offset
+        )
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
         
-        asyncio.run(mpu.tare())
+        await mpu.tare()
         
         # Tare offsets should be set
-        assert mpu.accel_x_offset == 0.1
-        assert mpu.accel_y_offset == 0.2
-        assert mpu.accel_z_offset == 9.8
-        assert mpu.gyro_x_offset == 0.01
-        assert mpu.gyro_y_offset == 0.02
-        assert mpu.gyro_z_offset == 0.03
+        assert mpu.accel_x_offset == pytest.approx(0.1, abs=ACCEL_TOL)
+        assert mpu.accel_y_offset == pytest.approx(0.2, abs=ACCEL_TOL)
+        assert mpu.accel_z_offset == pytest.approx(9.8, abs=ACCEL_TOL)
+        assert mpu.gyro_x_offset == pytest.approx(0.01, abs=GYRO_TOL)
+        assert mpu.gyro_y_offset == pytest.approx(0.02, abs=GYRO_TOL)
+        assert mpu.gyro_z_offset == pytest.approx(0.03, abs=GYRO_TOL)
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_tare_error_handling(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_tare_error_handling(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test tare error handling."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu_instance.acceleration = (0.1, 0.2, 9.8)  # Valid tuple
-        # Make gyro raise an exception when accessed
-        class GyroError:
-            def __getitem__(self, index):
-                raise Exception("Tare error")
-        mock_mpu_instance.gyro = GyroError()
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(error=OSError("Tare error"))
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
         
         with pytest.raises(Exception, match="Tare error"):
-            asyncio.run(mpu.tare())
+            await mpu.tare()
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_reset_tare(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_reset_tare(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test reset tare operation."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu_instance.acceleration = (0.1, 0.2, 9.8)
-        mock_mpu_instance.gyro = (0.01, 0.02, 0.03)
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(acceleration=(0.1, 0.2, 9.8), gyro=(0.01, 0.02, 0.03))
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
@@ -248,7 +358,7 @@ class TestMpu:
         mpu.gyro_y_offset = 0.02
         mpu.gyro_z_offset = 0.0
         
-        asyncio.run(mpu.reset_tare())
+        await mpu.reset_tare()
         
         # Tare offsets should be reset
         assert mpu.accel_x_offset == 0.0
@@ -258,23 +368,16 @@ class TestMpu:
         assert mpu.gyro_y_offset == 0.0
         assert mpu.gyro_z_offset == 0.0
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_commands_tare(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_commands_tare(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test tare command execution."""
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu_instance.acceleration = (0.1, 0.2, 9.8)
-        mock_mpu_instance.gyro = (0.01, 0.02, 0.03)
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(acceleration=(0.1, 0.2, 9.8), gyro=(0.01, 0.02, 0.03))
         
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
         
-        command = {"tare": []}
-        result = asyncio.run(mpu.do_command(command))
+        command = {"tare": {}}  # the README's example shape, arguments are ignored
+        result = await mpu.do_command(command)
         
         assert "tare" in result
         assert "accel_x_offset" in result["tare"]
@@ -283,17 +386,14 @@ class TestMpu:
         assert "gyro_x_offset" in result["tare"]
         assert "gyro_y_offset" in result["tare"]
         assert "gyro_z_offset" in result["tare"]
-        assert result["tare"]["accel_x_offset"] == 0.1
-        assert result["tare"]["accel_y_offset"] == 0.2
-        assert result["tare"]["accel_z_offset"] == 9.8
-        assert result["tare"]["gyro_x_offset"] == 0.01
-        assert result["tare"]["gyro_y_offset"] == 0.02
-        assert result["tare"]["gyro_z_offset"] == 0.03
+        assert result["tare"]["accel_x_offset"] == pytest.approx(0.1, abs=ACCEL_TOL)
+        assert result["tare"]["accel_y_offset"] == pytest.approx(0.2, abs=ACCEL_TOL)
+        assert result["tare"]["accel_z_offset"] == pytest.approx(9.8, abs=ACCEL_TOL)
+        assert result["tare"]["gyro_x_offset"] == pytest.approx(0.01, abs=GYRO_TOL)
+        assert result["tare"]["gyro_y_offset"] == pytest.approx(0.02, abs=GYRO_TOL)
+        assert result["tare"]["gyro_z_offset"] == pytest.approx(0.03, abs=GYRO_TOL)
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_commands_reset_tare(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_commands_reset_tare(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test reset tare command execution."""
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
@@ -307,31 +407,44 @@ class TestMpu:
         mpu.gyro_z_offset = 0.0
         
         command = {"reset_tare": []}
-        result = asyncio.run(mpu.do_command(command))
+        result = await mpu.do_command(command)
         
         assert "reset_tare" in result
         assert result["reset_tare"] == "reset successful"
     
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_commands_unknown(self, mock_mpu6050_class, mock_board, mock_busio, mock_component_config, mock_dependencies):
+    async def test_commands_get_batch(self, mpu_mocks, mock_component_config, mock_dependencies):
+        """Test the get_batch command returns the queued FIFO samples per reading key."""
+        sample = struct.pack(">hhhhhhh", 0, 0, 8192, 0, 0, 0, 0)  # 1 g on the Z axis
+        
+        def write_then_readinto(out_buffer, in_buffer, in_end=None):
+            in_buffer[:in_end] = (sample * 2)[:in_end]
+        
+        mpu_mocks.device.write_then_readinto.side_effect = write_then_readinto
+        mpu_mocks.sensor.fifo_count = 2 * len(sample)
+        
+        mpu = Mpu("test-mpu")
+        mpu.reconfigure(mock_component_config, mock_dependencies)
+        
+        result = await mpu.do_command({"get_batch": 2.0})  # protobuf numbers arrive as floats
+        
+        batch = result["get_batch"]
+        assert batch["acceleration_z - m/s²"] == pytest.approx([9.80665, 9.80665])
+        assert batch["gyro_x - rad/s"] == [0.0, 0.0]
+    
+    async def test_commands_unknown(self, mpu_mocks, mock_component_config, mock_dependencies):
         """Test handling of unknown commands."""
         mpu = Mpu("test-mpu")
         mpu.reconfigure(mock_component_config, mock_dependencies)
         
         command = {"unknown_command": []}
-        result = asyncio.run(mpu.do_command(command))
+        result = await mpu.do_command(command)
         
         assert "unknown_command" in result
         assert "error" in result["unknown_command"]
         assert "available_commands" in result["unknown_command"]
     
     @pytest.mark.integration
-    @patch('models.mpu.busio')
-    @patch('models.mpu.board')
-    @patch('models.mpu.adafruit_mpu6050')
-    def test_full_workflow(self, mock_mpu6050_class, mock_board, mock_busio, create_config_with_attributes, mock_dependencies):
+    async def test_full_workflow(self, mpu_mocks, create_config_with_attributes, mock_dependencies):
         """Test complete MPU workflow: configure, tare, read."""
         config = create_config_with_attributes({
             "i2c_address": 0x69,
@@ -339,20 +452,15 @@ class TestMpu:
             "sample_rate": 200
         })
         
-        mock_i2c = Mock()
-        mock_busio.I2C.return_value = mock_i2c
-        mock_mpu_instance = Mock()
-        mock_mpu_instance.acceleration = (0.1, 0.2, 9.8)
-        mock_mpu_instance.gyro = (0.01, 0.02, 0.03)
-        mock_mpu_instance.temperature = 25.0
-        mock_mpu6050_class.MPU6050.return_value = mock_mpu_instance
+        mock_mpu_instance = mpu_mocks.sensor
+        mock_mpu_instance.i2c_device = _sample_device(acceleration=(0.1, 0.2, 9.8), gyro=(0.01, 0.02, 0.03), temperature=25.0)
         
         # Initialize and configure
         mpu = Mpu("test-mpu")
         mpu.reconfigure(config, mock_dependencies)
         
         # Perform tare
-        asyncio.run(mpu.tare())
+        await mpu.tare()
         assert mpu.accel_x_offset is not None
         assert mpu.accel_y_offset is not None
         assert mpu.accel_z_offset is not None
@@ -361,7 +469,7 @@ class TestMpu:
         assert mpu.gyro_z_offset is not None
         
         # Get readings
-        readings = asyncio.run(mpu.get_readings())
+        readings = await mpu.get_readings()
         assert "acceleration_x - ft/s²" in readings
         assert "acceleration_y - ft/s²" in readings
         assert "acceleration_z - ft/s²" in readings
@@ -371,7 +479,7 @@ class TestMpu:
         assert "temperature - F" in readings
         
         # Reset tare
-        asyncio.run(mpu.reset_tare())
+        await mpu.reset_tare()
         assert mpu.accel_x_offset == 0.0
         assert mpu.accel_y_offset == 0.0
         assert mpu.accel_z_offset == 0.0